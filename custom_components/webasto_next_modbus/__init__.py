@@ -50,8 +50,8 @@ from .const import (
     SERVICE_STOP_SESSION,
     SESSION_COMMAND_START_VALUE,
     SESSION_COMMAND_STOP_VALUE,
-    SIGNAL_REGISTER_WRITTEN,
     build_device_slug,
+    build_register_written_signal,
     get_max_current_for_variant,
     get_model_display_name,
     get_readable_registers,
@@ -59,7 +59,11 @@ from .const import (
     normalize_model,
 )
 from .coordinator import WebastoDataCoordinator
-from .device_trigger import TRIGGER_KEEPALIVE_SENT, async_fire_device_trigger
+from .device_trigger import (
+    TRIGGER_KEEPALIVE_SENT,
+    async_fire_device_trigger,
+    async_release_device_slug_cache,
+)
 from .hub import ModbusBridge, WebastoModbusError
 
 _LOGGER = logging.getLogger(__name__)
@@ -246,6 +250,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: WebastoConfigEntry) ->
         await runtime.bridge.async_close()
         _LOGGER.debug("Connection closed for entry %s", entry.entry_id)
 
+    # The entry being unloaded still counts as loaded here.
+    if not any(
+        other.entry_id != entry.entry_id
+        for other in hass.config_entries.async_loaded_entries(DOMAIN)
+    ):
+        async_release_device_slug_cache(hass)
+
     _LOGGER.info("Config entry %s unloaded successfully", entry.entry_id)
     return unload_ok
 
@@ -399,9 +410,7 @@ async def _async_service_set_current(call: ServiceCall) -> None:
         ) from err
     async_dispatcher_send(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        register.key,
+        build_register_written_signal(runtime.device_slug, register.key),
         value,
     )
     await runtime.coordinator.async_request_refresh()
@@ -425,9 +434,7 @@ async def _async_service_set_failsafe(call: ServiceCall) -> None:
         ) from err
     async_dispatcher_send(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        amps_register.key,
+        build_register_written_signal(runtime.device_slug, amps_register.key),
         amps_value,
     )
 
@@ -448,9 +455,7 @@ async def _async_service_set_failsafe(call: ServiceCall) -> None:
             ) from err
         async_dispatcher_send(
             call.hass,
-            SIGNAL_REGISTER_WRITTEN,
-            runtime.device_slug,
-            timeout_register.key,
+            build_register_written_signal(runtime.device_slug, timeout_register.key),
             timeout_value,
         )
 
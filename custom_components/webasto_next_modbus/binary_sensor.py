@@ -6,13 +6,12 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.const import CONF_HOST, EntityCategory
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import WebastoConfigEntry
-from .const import CONF_UNIT_ID, build_device_slug
 from .coordinator import WebastoDataCoordinator
 from .entity import build_device_info
 
@@ -27,12 +26,10 @@ async def async_setup_entry(
     """Set up the connectivity and charging binary sensors."""
 
     runtime = entry.runtime_data
-    host = entry.data[CONF_HOST]
-    unit_id = entry.data[CONF_UNIT_ID]
     async_add_entities(
         [
-            WebastoConnectivitySensor(runtime.coordinator, host, unit_id, runtime.device_name),
-            WebastoChargingSensor(runtime.coordinator, host, unit_id, runtime.device_name),
+            WebastoConnectivitySensor(runtime.coordinator, runtime.device_name),
+            WebastoChargingSensor(runtime.coordinator, runtime.device_name),
         ]
     )
 
@@ -48,12 +45,10 @@ class WebastoConnectivitySensor(CoordinatorEntity[WebastoDataCoordinator], Binar
     def __init__(
         self,
         coordinator: WebastoDataCoordinator,
-        host: str,
-        unit_id: int,
         device_name: str,
     ) -> None:
         super().__init__(coordinator)
-        prefix = build_device_slug(host, unit_id)
+        prefix = coordinator.device_slug
         self._unique_prefix = prefix
         self._device_name = device_name
         self._attr_unique_id = f"{prefix}-connected"
@@ -87,12 +82,10 @@ class WebastoChargingSensor(CoordinatorEntity[WebastoDataCoordinator], BinarySen
     def __init__(
         self,
         coordinator: WebastoDataCoordinator,
-        host: str,
-        unit_id: int,
         device_name: str,
     ) -> None:
         super().__init__(coordinator)
-        prefix = build_device_slug(host, unit_id)
+        prefix = coordinator.device_slug
         self._unique_prefix = prefix
         self._device_name = device_name
         self._attr_unique_id = f"{prefix}-charging"
@@ -811,6 +811,20 @@ _SWITCH_REGISTERS_BY_MODEL: Final[dict[str, tuple[RegisterDefinition, ...]]] = {
     MODEL_UNITE: UNITE_SWITCH_REGISTERS,
 }
 
+# Polled registers, precomputed per (model, include_write_only).
+_READABLE_REGISTERS_BY_MODEL: Final[dict[tuple[str, bool], tuple[RegisterDefinition, ...]]] = {
+    (model, include_write_only): (
+        *_SENSOR_REGISTERS_BY_MODEL[model],
+        *(
+            register
+            for register in _NUMBER_REGISTERS_BY_MODEL[model]
+            if include_write_only or not register.write_only
+        ),
+    )
+    for model in _SENSOR_REGISTERS_BY_MODEL
+    for include_write_only in (False, True)
+}
+
 
 def normalize_model(model: str | None) -> str:
     """Return a known model identifier, falling back to the default."""
@@ -859,12 +873,7 @@ def get_readable_registers(
 ) -> tuple[RegisterDefinition, ...]:
     """Return every register that should be polled for the given model."""
 
-    model = normalize_model(model)
-    regs: list[RegisterDefinition] = list(_SENSOR_REGISTERS_BY_MODEL[model])
-    for register in _NUMBER_REGISTERS_BY_MODEL[model]:
-        if include_write_only or not register.write_only:
-            regs.append(register)
-    return tuple(regs)
+    return _READABLE_REGISTERS_BY_MODEL[normalize_model(model), bool(include_write_only)]
 
 
 def all_registers(include_write_only: bool = False) -> tuple[RegisterDefinition, ...]:
@@ -873,10 +882,11 @@ def all_registers(include_write_only: bool = False) -> tuple[RegisterDefinition,
     return get_readable_registers(MODEL_NEXT, include_write_only)
 
 
-def get_register(key: str) -> RegisterDefinition:
-    """Retrieve a register definition by key across all supported models."""
+def _collect_all_registers() -> tuple[RegisterDefinition, ...]:
+    """Concatenate every model's register collections, skipping shared ones."""
 
     seen: set[int] = set()
+    registers: list[RegisterDefinition] = []
     for collection in (
         *_SENSOR_REGISTERS_BY_MODEL.values(),
         *_NUMBER_REGISTERS_BY_MODEL.values(),
@@ -887,9 +897,20 @@ def get_register(key: str) -> RegisterDefinition:
         if id(collection) in seen:
             continue
         seen.add(id(collection))
-        for register in collection:
-            if register.key == key:
-                return register
+        registers.extend(collection)
+    return tuple(registers)
+
+
+# Every definition across all models, in lookup priority order (Next first).
+_ALL_DEFS: Final[tuple[RegisterDefinition, ...]] = _collect_all_registers()
+
+
+def get_register(key: str) -> RegisterDefinition:
+    """Retrieve a register definition by key across all supported models."""
+
+    for register in _ALL_DEFS:
+        if register.key == key:
+            return register
     raise KeyError(key)
 
 
@@ -899,6 +920,15 @@ def build_device_slug(host: str, unit_id: int) -> str:
     return f"{host.lower()}-{unit_id}"
 
 
+def build_register_written_signal(device_slug: str, register_key: str) -> str:
+    """Return the dispatcher signal announcing a service write to one register.
+
+    Keyed per device and register so a write only reaches the entity backing it.
+    """
+
+    return f"{SIGNAL_REGISTER_WRITTEN}_{device_slug}_{register_key}"
+
+
 def get_max_current_for_variant(variant: str | None) -> int:
     """Return the maximum supported current for the configured variant."""
 
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_REST_ENABLED,
@@ -47,6 +51,37 @@ _LOGGER = logging.getLogger(__name__)
 class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinate Modbus polling and expose decoded values."""
 
+    # DataUpdateCoordinator itself is not slotted, so instances keep a
+    # ``__dict__``; the slots just turn our own per-poll state into fixed
+    # offsets instead of dict lookups.
+    __slots__ = (
+        "_bridge",
+        "_connection_online",
+        "_device_slug",
+        "_failure_message_base",
+        "_host",
+        "_last_charging_state",
+        "_last_success",
+        "_last_success_monotonic",
+        "_model",
+        "_notification_active",
+        "_notification_id",
+        "_rest_client",
+        "_rest_data",
+        "_rest_fetch_task",
+        "_rest_fetch_warned",
+        "_rest_setup_retry_at",
+        "_rest_setup_retry_interval",
+        "_rest_unsub",
+        "_rest_update_interval",
+        "consecutive_failures",
+        "device_model_name",
+        "entry_id",
+        "last_error",
+        "last_failure",
+        "rest_revision",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -59,22 +94,43 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         model: str = MODEL_NEXT,
     ) -> None:
         self._bridge = bridge
+        self._host = bridge.host
         self._device_slug = device_slug
         self.device_model_name = device_model_name
         self._model = model
         self.entry_id = entry_id
         self.consecutive_failures = 0
-        self.last_success: datetime | None = None
+        # Successful polls only record a monotonic timestamp; the datetime
+        # exposed via ``last_success`` is built lazily when someone asks.
+        self._last_success_monotonic: float | None = None
+        self._last_success: datetime | None = None
         self.last_failure: datetime | None = None
         self.last_error: str | None = None
         self._connection_online = True
+        # Last charging_state seen, so the steady-state poll can skip the
+        # transition check without touching the previous data dict.
+        self._last_charging_state: int | None = None
         self._notification_id = f"{DOMAIN}_connection_{entry_id}"
+        self._notification_active = False
+        self._failure_message_base = (
+            "Home Assistant konnte die Verbindung zur Webasto Next Wallbox "
+            f"({bridge.endpoint}) wiederholt nicht herstellen. Prüfe Netzwerk, "
+            "Stromversorgung und Zugangsdaten."
+        )
 
         # REST API client (optional)
         self._rest_client: RestClient | None = None
         self._rest_data: RestData | None = None
-        self._rest_last_update: datetime | None = None
+        # Bumped whenever _rest_data is replaced so entities can cache what
+        # they derive from it (e.g. DeviceInfo).
+        self.rest_revision = 0
         self._rest_update_interval = timedelta(seconds=REST_SCAN_INTERVAL)
+        # REST polling runs on its own timer instead of piggybacking on the
+        # (much more frequent) Modbus poll.
+        self._rest_unsub: CALLBACK_TYPE | None = None
+        # REST fetches run as background tasks so a slow wallbox web UI never
+        # holds up setup or the Modbus poll; at most one is in flight.
+        self._rest_fetch_task: asyncio.Task[None] | None = None
         # When the initial REST connect fails (e.g. the wallbox was still
         # booting), retry it from the data poll once this time has passed.
         self._rest_setup_retry_at: datetime | None = None
@@ -108,16 +164,30 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Import here to avoid circular imports
         from .rest_client import AuthenticationError, RestClient
 
-        host = self._bridge.endpoint.split(":")[0]
         # Use Home Assistant's shared aiohttp session. The wallbox has a
         # self-signed certificate, so SSL verification must be disabled.
         session = async_get_clientsession(self.hass, verify_ssl=False)
-        self._rest_client = RestClient(host, username, password, session, model=self._model)
+        self._rest_client = RestClient(
+            self._host,
+            username,
+            password,
+            session,
+            model=self._model,
+            json_loads=json_loads,
+        )
 
         try:
             await self._rest_client.connect()
             _LOGGER.info("REST API client connected successfully")
             self._rest_setup_retry_at = None
+            self._cancel_rest_polling()
+            self._schedule_rest_fetch()
+            self._rest_unsub = async_track_time_interval(
+                self.hass,
+                self._async_rest_tick,
+                self._rest_update_interval,
+                name="Webasto Next REST poll",
+            )
         except AuthenticationError as err:
             _LOGGER.warning("REST API authentication failed: %s", err)
             with contextlib.suppress(Exception):
@@ -139,10 +209,48 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_shutdown_rest_client(self) -> None:
         """Disconnect the REST client."""
+        self._cancel_rest_polling()
+        if self._rest_fetch_task is not None:
+            self._rest_fetch_task.cancel()
+            self._rest_fetch_task = None
         if self._rest_client is not None:
             await self._rest_client.disconnect()
             self._rest_client = None
             self._rest_data = None
+            self.rest_revision += 1
+
+    def _cancel_rest_polling(self) -> None:
+        if self._rest_unsub is not None:
+            self._rest_unsub()
+            self._rest_unsub = None
+
+    @callback
+    def _async_rest_tick(self, _now: datetime) -> None:
+        """Refresh REST data on the REST poll timer."""
+        self._schedule_rest_fetch()
+
+    @callback
+    def _schedule_rest_fetch(self) -> None:
+        """Start a background REST fetch unless one is still running."""
+        if self._rest_fetch_task is not None and not self._rest_fetch_task.done():
+            _LOGGER.debug("Previous REST fetch still running, skipping this one")
+            return
+        assert self.config_entry is not None  # REST is only set up with an entry
+        self._rest_fetch_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_rest_fetch(),
+            name="Webasto Next REST fetch",
+        )
+
+    async def _async_rest_fetch(self) -> None:
+        """Fetch REST data and notify entities."""
+        await self._async_update_rest_data()
+        self.async_update_listeners()
+
+    @property
+    def device_slug(self) -> str:
+        """Return the device slug entities build their unique IDs from."""
+        return self._device_slug
 
     @property
     def rest_client(self) -> RestClient | None:
@@ -159,86 +267,111 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return cached REST data."""
         return self._rest_data
 
+    @property
+    def last_success(self) -> datetime | None:
+        """Return the time of the last successful poll."""
+        if self._last_success_monotonic is None:
+            return None
+        if self._last_success is None:
+            age = time.monotonic() - self._last_success_monotonic
+            self._last_success = datetime.now(UTC) - timedelta(seconds=age)
+        return self._last_success
+
     async def _async_update_data(self) -> dict[str, Any]:
-        previous_data: dict[str, Any] | None = self.data if isinstance(self.data, dict) else None
+        # The coordinator only ever stores the bridge's dict (or None before the
+        # first refresh), so no runtime type check is needed here.
+        previous_data: dict[str, Any] | None = self.data
         try:
             data = await self._bridge.async_read_data()
         except WebastoModbusError as err:
-            self.consecutive_failures += 1
-            self.last_failure = datetime.now(UTC)
-            self.last_error = str(err)
-            if self._connection_online:
-                self._connection_online = False
-                async_fire_device_trigger(
-                    self.hass,
-                    self._device_slug,
-                    TRIGGER_CONNECTION_LOST,
-                    {"error": str(err)},
-                )
-            if self.consecutive_failures >= FAILURE_NOTIFICATION_THRESHOLD:
-                self._ensure_failure_notification()
+            self._handle_failure(err)
             raise UpdateFailed(str(err)) from err
-        else:
-            restored = not self._connection_online
-            self.consecutive_failures = 0
-            self.last_success = datetime.now(UTC)
-            self.last_error = None
-            self._dismiss_failure_notification()
-            if restored:
-                self._connection_online = True
-                async_fire_device_trigger(
-                    self.hass,
-                    self._device_slug,
-                    TRIGGER_CONNECTION_RESTORED,
-                    {"timestamp": self.last_success.isoformat()},
-                )
-            self._emit_charging_triggers(previous_data, data)
-            self._emit_cable_triggers(previous_data, data)
-            self._emit_fault_trigger(previous_data, data)
-
-            # The Modbus side is up, so the wallbox is reachable: if a previous
-            # REST setup failed, retry it now (throttled).
-            if (
-                self._rest_client is None
-                and self._rest_setup_retry_at is not None
-                and datetime.now(UTC) >= self._rest_setup_retry_at
-            ):
-                await self.async_setup_rest_client()
-
-            # Fetch REST data if client is connected and interval elapsed
-            await self._async_update_rest_data()
-
-            return data
+
+        await self._async_handle_success(previous_data, data)
+        return data
+
+    def _handle_failure(self, err: WebastoModbusError) -> None:
+        """Track a failed poll and fire the connection-lost trigger on the edge."""
+        self.consecutive_failures += 1
+        self.last_failure = datetime.now(UTC)
+        self.last_error = str(err)
+        if self._connection_online:
+            self._connection_online = False
+            async_fire_device_trigger(
+                self.hass,
+                self._device_slug,
+                TRIGGER_CONNECTION_LOST,
+                {"error": str(err)},
+            )
+        if self.consecutive_failures >= FAILURE_NOTIFICATION_THRESHOLD:
+            self._ensure_failure_notification()
+
+    async def _async_handle_success(
+        self,
+        previous: dict[str, Any] | None,
+        data: dict[str, Any],
+    ) -> None:
+        """Reset failure state, fire device triggers and refresh REST data."""
+        restored = not self._connection_online
+        self.consecutive_failures = 0
+        self._last_success_monotonic = time.monotonic()
+        self._last_success = None
+        self.last_error = None
+        self._dismiss_failure_notification()
+        if restored:
+            self._connection_online = True
+            self._last_success = datetime.now(UTC)
+            async_fire_device_trigger(
+                self.hass,
+                self._device_slug,
+                TRIGGER_CONNECTION_RESTORED,
+                {"timestamp": self._last_success.isoformat()},
+            )
+        self._emit_charging_triggers(data)
+        self._emit_cable_triggers(previous, data)
+        self._emit_fault_trigger(previous, data)
+
+        # The Modbus side is up, so the wallbox is reachable: if a previous
+        # REST setup failed, retry it now (throttled). It runs in the
+        # background so a slow web UI doesn't delay this poll's data; a failed
+        # attempt sets the next retry time again.
+        if (
+            self.config_entry is not None
+            and self._rest_client is None
+            and self._rest_setup_retry_at is not None
+            and datetime.now(UTC) >= self._rest_setup_retry_at
+        ):
+            self._rest_setup_retry_at = None
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_setup_rest_client(),
+                name="Webasto Next REST setup retry",
+            )
 
     async def async_refresh_rest_data(self) -> None:
         """Force an immediate REST data re-fetch (e.g. after a REST write).
 
-        Regular REST polling is throttled to ``REST_SCAN_INTERVAL``; after we
-        change something via REST we want the new value reflected right away
-        instead of bouncing back to the stale cached value on the next Modbus
-        poll.
+        Regular REST polling runs every ``REST_SCAN_INTERVAL``; after we change
+        something via REST we want the new value reflected right away instead
+        of bouncing back to the stale cached value until the next REST poll.
         """
         if self._rest_client is None:
             return
-        await self._async_update_rest_data(force=True)
+        # Let a timer fetch that is still running land first; otherwise its
+        # older result could overwrite the one fetched here.
+        if self._rest_fetch_task is not None and not self._rest_fetch_task.done():
+            await asyncio.wait((self._rest_fetch_task,))
+        await self._async_update_rest_data()
         self.async_update_listeners()
 
-    async def _async_update_rest_data(self, force: bool = False) -> None:
-        """Fetch REST API data if enabled and the interval has passed."""
+    async def _async_update_rest_data(self) -> None:
+        """Fetch REST API data if the client is connected."""
         if self._rest_client is None:
             return
 
-        now = datetime.now(UTC)
-        if (
-            not force
-            and self._rest_last_update is not None
-            and now - self._rest_last_update < self._rest_update_interval
-        ):
-            return
-
         try:
             self._rest_data = await self._rest_client.get_data()
-            self._rest_last_update = now
+            self.rest_revision += 1
             _LOGGER.debug("REST data updated: %s", self._rest_data)
             if self._rest_fetch_warned:
                 _LOGGER.info("REST data fetch recovered")
@@ -251,48 +384,39 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else:
                 _LOGGER.debug("Still failing to fetch REST data: %s", err)
 
-    def _emit_charging_triggers(
-        self,
-        previous: dict[str, Any] | None,
-        current: dict[str, Any],
-    ) -> None:
-        if not previous:
-            return
-
-        previous_state_raw = previous.get("charging_state")
-        current_state_raw = current.get("charging_state")
-        if previous_state_raw is None or current_state_raw is None:
+    def _emit_charging_triggers(self, current: dict[str, Any]) -> None:
+        current_raw = current.get("charging_state")
+        if current_raw is None or current_raw == self._last_charging_state:
             return
 
         try:
-            previous_state = int(previous_state_raw)
-            current_state = int(current_state_raw)
+            current_state = int(current_raw)
         except TypeError, ValueError:
             return
 
-        if previous_state == current_state:
+        previous_state = self._last_charging_state
+        self._last_charging_state = current_state
+        # The first observed state only seeds the cache; there is no edge yet.
+        if previous_state is None or previous_state == current_state:
             return
 
-        extra = {
-            "charging_state": current_state,
-            "previous_state": previous_state,
-            "charge_point_state": current.get("charge_point_state"),
-        }
-
         if current_state == 1:
-            async_fire_device_trigger(
-                self.hass,
-                self._device_slug,
-                TRIGGER_CHARGING_STARTED,
-                extra,
-            )
+            trigger_type = TRIGGER_CHARGING_STARTED
         elif previous_state == 1 and current_state == 0:
-            async_fire_device_trigger(
-                self.hass,
-                self._device_slug,
-                TRIGGER_CHARGING_STOPPED,
-                extra,
-            )
+            trigger_type = TRIGGER_CHARGING_STOPPED
+        else:
+            return
+
+        async_fire_device_trigger(
+            self.hass,
+            self._device_slug,
+            trigger_type,
+            {
+                "charging_state": current_state,
+                "previous_state": previous_state,
+                "charge_point_state": current.get("charge_point_state"),
+            },
+        )
 
     def _emit_cable_triggers(
         self,
@@ -313,13 +437,19 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if previous_state == current_state:
             return
 
-        extra = {"cable_state": current_state, "previous_state": previous_state}
         if previous_state == 0 and current_state >= 1:
-            async_fire_device_trigger(self.hass, self._device_slug, TRIGGER_CABLE_CONNECTED, extra)
+            trigger_type = TRIGGER_CABLE_CONNECTED
         elif previous_state >= 1 and current_state == 0:
-            async_fire_device_trigger(
-                self.hass, self._device_slug, TRIGGER_CABLE_DISCONNECTED, extra
-            )
+            trigger_type = TRIGGER_CABLE_DISCONNECTED
+        else:
+            return
+
+        async_fire_device_trigger(
+            self.hass,
+            self._device_slug,
+            trigger_type,
+            {"cable_state": current_state, "previous_state": previous_state},
+        )
 
     def _emit_fault_trigger(
         self,
@@ -349,19 +479,19 @@ class WebastoDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
     def _ensure_failure_notification(self) -> None:
-        message = (
-            "Home Assistant konnte die Verbindung zur Webasto Next Wallbox "
-            f"({self._bridge.endpoint}) wiederholt nicht herstellen. Prüfe Netzwerk, "
-            "Stromversorgung und Zugangsdaten."
-        )
+        message = self._failure_message_base
         if self.last_error:
-            message += f"\nLetzte Fehlermeldung: {self.last_error}"
+            message = f"{message}\nLetzte Fehlermeldung: {self.last_error}"
         persistent_notification.async_create(
             self.hass,
             message,
             FAILURE_NOTIFICATION_TITLE,
             self._notification_id,
         )
+        self._notification_active = True
 
     def _dismiss_failure_notification(self) -> None:
+        if not self._notification_active:
+            return
         persistent_notification.async_dismiss(self.hass, self._notification_id)
+        self._notification_active = False
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.components.device_automation.exceptions import (
@@ -14,10 +15,9 @@ from homeassistant.const import (
     CONF_PLATFORM,
     CONF_TYPE,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
@@ -43,6 +43,8 @@ TRIGGER_TYPES: tuple[str, ...] = (
     TRIGGER_FAULT_OCCURRED,
 )
 
+_KNOWN_TRIGGER_TYPES: Final = frozenset(TRIGGER_TYPES)
+
 TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Optional(CONF_DOMAIN): vol.In([DOMAIN]),
@@ -51,7 +53,25 @@ TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     }
 )
 
-SIGNAL_DEVICE_TRIGGER = "webasto_next_modbus_device_trigger_{device_slug}"
+# The device-independent part of every trigger description, built once.
+_TRIGGER_TEMPLATES: Final[tuple[dict[str, str], ...]] = tuple(
+    {CONF_PLATFORM: "device", CONF_DOMAIN: DOMAIN, CONF_TYPE: trigger_type}
+    for trigger_type in TRIGGER_TYPES
+)
+
+# hass.data key for the device id -> slug cache used by the trigger lookups.
+_DATA_SLUG_CACHE: Final = f"{DOMAIN}_device_trigger_slugs"
+
+# hass.data key for the unsubscribe callback of the cache's registry listener.
+_DATA_SLUG_CACHE_UNSUB: Final = f"{DOMAIN}_device_trigger_slugs_unsub"
+
+# hass.data key for attached triggers: (device slug, trigger type) -> jobs.
+# Firing looks the jobs up with a single key instead of fanning out over a
+# dispatcher signal to every attached trigger of the device.
+_DATA_TRIGGER_JOBS: Final = f"{DOMAIN}_device_trigger_jobs"
+
+# (action job, payload base, context), all resolved once at attach time.
+type _AttachedTrigger = tuple[HassJob[..., Any], dict[str, Any], Context | None]
 
 
 def _get_device_slug(device_entry: dr.DeviceEntry | None) -> str | None:
@@ -63,27 +83,55 @@ def _get_device_slug(device_entry: dr.DeviceEntry | None) -> str | None:
     return None
 
 
+@callback
+def _slug_for_device_id(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the device slug for a device id, caching registry lookups."""
+
+    cache: dict[str, str] | None = hass.data.get(_DATA_SLUG_CACHE)
+    if cache is None:
+        cache = hass.data[_DATA_SLUG_CACHE] = {}
+        slug_cache = cache
+
+        @callback
+        def _async_device_registry_updated(
+            event: Event[dr.EventDeviceRegistryUpdatedData],
+        ) -> None:
+            if event.data["action"] in ("remove", "update"):
+                slug_cache.pop(event.data["device_id"], None)
+
+        hass.data[_DATA_SLUG_CACHE_UNSUB] = hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_device_registry_updated
+        )
+
+    if (slug := cache.get(device_id)) is not None:
+        return slug
+
+    slug = _get_device_slug(dr.async_get(hass).async_get(device_id))
+    if slug is not None:
+        cache[device_id] = slug
+    return slug
+
+
+@callback
+def async_release_device_slug_cache(hass: HomeAssistant) -> None:
+    """Drop the slug cache and stop listening for device registry updates."""
+
+    hass.data.pop(_DATA_SLUG_CACHE, None)
+    if (unsub := hass.data.pop(_DATA_SLUG_CACHE_UNSUB, None)) is not None:
+        unsub()
+
+
 async def async_get_triggers(
     hass: HomeAssistant,
     device_id: str,
 ) -> list[dict[str, Any]]:
     """Return a list of device triggers for the given device."""
 
-    device_registry = dr.async_get(hass)
-    device_entry = device_registry.async_get(device_id)
-    device_slug = _get_device_slug(device_entry)
+    device_slug = _slug_for_device_id(hass, device_id)
     if not device_slug:
         return []
 
-    return [
-        {
-            CONF_PLATFORM: "device",
-            CONF_DOMAIN: DOMAIN,
-            CONF_DEVICE_ID: device_id,
-            CONF_TYPE: trigger_type,
-        }
-        for trigger_type in TRIGGER_TYPES
-    ]
+    return [{**template, CONF_DEVICE_ID: device_id} for template in _TRIGGER_TEMPLATES]
 
 
 async def async_attach_trigger(
@@ -94,55 +142,64 @@ async def async_attach_trigger(
 ) -> CALLBACK_TYPE:
     """Attach a device trigger."""
 
-    config = TRIGGER_SCHEMA(config)
+    # Home Assistant validates the config against TRIGGER_SCHEMA before it
+    # attaches the trigger, so only guard the one value used as a lookup key.
     device_id = config[CONF_DEVICE_ID]
     trigger_type = config[CONF_TYPE]
+    if trigger_type not in _KNOWN_TRIGGER_TYPES:
+        raise InvalidDeviceAutomationConfig(f"Unknown trigger type {trigger_type}")
 
-    device_registry = dr.async_get(hass)
-    device_entry = device_registry.async_get(device_id)
-    device_slug = _get_device_slug(device_entry)
+    device_slug = _slug_for_device_id(hass, device_id)
     if not device_slug:
         raise InvalidDeviceAutomationConfig(
             f"Device {device_id} is not a Webasto Next Modbus device"
         )
 
-    @callback
-    def _handle_trigger(event_type: str, extra: dict[str, Any] | None) -> None:
-        if event_type != trigger_type:
-            return
-
-        payload: dict[str, Any] = {
+    attached: _AttachedTrigger = (
+        HassJob(action, f"{DOMAIN} device trigger {trigger_type}"),
+        {
             CONF_PLATFORM: "device",
             CONF_DOMAIN: DOMAIN,
             CONF_DEVICE_ID: device_id,
             CONF_TYPE: trigger_type,
-        }
-        if extra:
-            payload.update(extra)
-        context = getattr(trigger_info, "context", None)
-        hass.async_create_task(action(payload, context))
-
-    return async_dispatcher_connect(
-        hass,
-        SIGNAL_DEVICE_TRIGGER.format(device_slug=device_slug),
-        _handle_trigger,
+        },
+        getattr(trigger_info, "context", None),
     )
+    key = (device_slug, trigger_type)
+    triggers: dict[tuple[str, str], list[_AttachedTrigger]] = hass.data.setdefault(
+        _DATA_TRIGGER_JOBS, {}
+    )
+    jobs = triggers.setdefault(key, [])
+    jobs.append(attached)
 
+    @callback
+    def _async_detach() -> None:
+        jobs.remove(attached)
+        # Don't leave an empty bucket behind once the last trigger is gone.
+        if not jobs and triggers.get(key) is jobs:
+            del triggers[key]
 
+    return _async_detach
+
+
+@callback
 def async_fire_device_trigger(
     hass: HomeAssistant,
     device_slug: str,
     trigger_type: str,
-    extra: dict[str, Any] | None = None,
+    extra: Mapping[str, Any] | None = None,
 ) -> None:
     """Fire a device trigger for the given device slug."""
 
-    if trigger_type not in TRIGGER_TYPES:
+    # Most fires have no automation attached, so bail out after a single
+    # lookup. Unknown trigger types can never be attached and miss here too.
+    triggers = hass.data.get(_DATA_TRIGGER_JOBS)
+    if not triggers or not (jobs := triggers.get((device_slug, trigger_type))):
         return
 
-    async_dispatcher_send(
-        hass,
-        SIGNAL_DEVICE_TRIGGER.format(device_slug=device_slug),
-        trigger_type,
-        extra or {},
-    )
+    # Copy: an action may detach its own trigger while we iterate.
+    for job, base_payload, context in tuple(jobs):
+        # Every run gets its own payload so an action can't leak changes into
+        # the next firing.
+        payload = {**base_payload, **extra} if extra else dict(base_payload)
+        hass.async_run_hass_job(job, payload, context)
@@ -28,24 +28,22 @@ async def async_get_config_entry_diagnostics(
     runtime = entry.runtime_data
     coordinator = runtime.coordinator
 
-    # Include current register values for debugging
-    register_data: dict[str, Any] = {}
-    if coordinator.data:
-        register_data = dict(coordinator.data)
-
     return {
         "config_entry": {
-            "data": async_redact_data(dict(entry.data), TO_REDACT),
-            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            # async_redact_data accepts any mapping and returns a new dict.
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
         },
         "runtime": {
             "model": runtime.model,
             "variant": runtime.variant,
             "max_current": runtime.max_current,
-            "last_success": _iso_or_none(getattr(coordinator, "last_success", None)),
-            "last_failure": _iso_or_none(getattr(coordinator, "last_failure", None)),
-            "consecutive_failures": getattr(coordinator, "consecutive_failures", 0),
-            "last_error": getattr(coordinator, "last_error", None),
+            "last_success": _iso_or_none(coordinator.last_success),
+            "last_failure": _iso_or_none(coordinator.last_failure),
+            "consecutive_failures": coordinator.consecutive_failures,
+            "last_error": coordinator.last_error,
         },
-        "registers": register_data,
+        # Current register values for debugging. The coordinator replaces its
+        # data dict on every poll, so it is safe to hand out without a copy.
+        "registers": coordinator.data or {},
     }
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.const import EntityCategory
 from homeassistant.exceptions import HomeAssistantError
@@ -14,7 +15,6 @@ from .const import (
     MANUFACTURER,
     MODEL,
     RegisterDefinition,
-    build_device_slug,
 )
 from .coordinator import WebastoDataCoordinator
 from .hub import ModbusBridge, WebastoModbusError
@@ -22,6 +22,16 @@ from .hub import ModbusBridge, WebastoModbusError
 if TYPE_CHECKING:
     from .rest_client import RestClient
 
+# Entity categories by their string value, so definitions map without a
+# raising enum lookup per entity
+_ENTITY_CATEGORIES: Final = MappingProxyType({member.value: member for member in EntityCategory})
+
+
+def get_entity_category(value: str | None) -> EntityCategory | None:
+    """Return the entity category for a definition's string value, if known."""
+
+    return _ENTITY_CATEGORIES.get(value) if value is not None else None
+
 
 def build_device_info(
     unique_prefix: str,
@@ -74,27 +84,31 @@ class WebastoRegisterEntity(CoordinatorEntity[WebastoDataCoordinator]):
         self._host = host
         self._unit_id = unit_id
         self._register = register
-        self._unique_prefix = build_device_slug(host, unit_id)
+        # The slug is computed once per config entry at setup; keep it as a
+        # plain attribute so unique_id, device info and signals reuse it.
+        self._unique_prefix = coordinator.device_slug
         self._device_name = device_name
 
         self._attr_has_entity_name = True
         self._attr_translation_key = register.translation_key or register.key
         self._attr_unique_id = f"{self._unique_prefix}-{register.key}"
+        # DeviceInfo only depends on the REST data, so rebuild it only when
+        # the coordinator reports new REST data.
+        self._device_info_revision = coordinator.rest_revision
         self._attr_device_info = build_device_info(
             self._unique_prefix, self._device_name, self.coordinator
         )
 
-        if register.entity_category:
-            try:
-                self._attr_entity_category = EntityCategory(register.entity_category)
-            except ValueError:
-                pass
+        if (category := get_entity_category(register.entity_category)) is not None:
+            self._attr_entity_category = category
 
     def _handle_coordinator_update(self) -> None:
         """Update cached device info and write updated coordinator data."""
-        self._attr_device_info = build_device_info(
-            self._unique_prefix, self._device_name, self.coordinator
-        )
+        if self._device_info_revision != self.coordinator.rest_revision:
+            self._device_info_revision = self.coordinator.rest_revision
+            self._attr_device_info = build_device_info(
+                self._unique_prefix, self._device_name, self.coordinator
+            )
         super()._handle_coordinator_update()
 
     @property
@@ -137,25 +151,35 @@ class WebastoRestEntity(CoordinatorEntity[WebastoDataCoordinator]):
         self._host = host
         self._unit_id = unit_id
         self._entity_key = entity_key
-        self._unique_prefix = build_device_slug(host, unit_id)
+        self._unique_prefix = coordinator.device_slug
         self._device_name = device_name
         self._rest_client = rest_client
 
         self._attr_has_entity_name = True
         self._attr_translation_key = entity_key
         self._attr_unique_id = f"{self._unique_prefix}-rest-{entity_key}"
+        # DeviceInfo only depends on the REST data, so rebuild it only when
+        # the coordinator reports new REST data.
+        self._device_info_revision = coordinator.rest_revision
         self._attr_device_info = build_device_info(
             self._unique_prefix, self._device_name, self.coordinator
         )
+        self._attr_available = coordinator.rest_enabled and coordinator.rest_data is not None
 
     def _handle_coordinator_update(self) -> None:
-        """Update cached device info and write updated coordinator data."""
-        self._attr_device_info = build_device_info(
-            self._unique_prefix, self._device_name, self.coordinator
-        )
+        """Update cached device info and availability, then write the state."""
+        coordinator = self.coordinator
+        if self._device_info_revision != coordinator.rest_revision:
+            self._device_info_revision = coordinator.rest_revision
+            self._attr_device_info = build_device_info(
+                self._unique_prefix, self._device_name, coordinator
+            )
+        # Availability only changes with the coordinator state, so compute it
+        # here instead of on every state write.
+        self._attr_available = coordinator.rest_enabled and coordinator.rest_data is not None
         super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return True if REST data is available."""
-        return self.coordinator.rest_enabled and self.coordinator.rest_data is not None
+        return self._attr_available
@@ -5,9 +5,12 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
-import time
+import socket
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
+from functools import cache, partial
+from operator import mul
+from struct import Struct
 from typing import Any, Final, TypeVar, cast
 
 from .const import (
@@ -21,15 +24,44 @@ from .const import (
 
 try:  # pragma: no cover - optional dependency import
     from pymodbus.client import AsyncModbusTcpClient as _AsyncModbusTcpClient
+    from pymodbus.exceptions import ConnectionException as _ConnectionException
     from pymodbus.exceptions import ModbusException as _ModbusException
 except ImportError:  # pragma: no cover - handled at runtime
     _AsyncModbusTcpClient = None  # type: ignore[assignment, misc]
+    _ConnectionException = None  # type: ignore[assignment, misc]
     _ModbusException = None  # type: ignore[assignment, misc]
 
 _LOGGER = logging.getLogger(__name__)
 
 MAX_REGISTERS_PER_REQUEST: Final = 110
 
+# Largest run of unused registers the read planner bridges to merge two
+# blocks. Reading up to 8 extra registers (16 bytes) is far cheaper than an
+# additional Modbus/TCP round trip. A firmware that rejects reads of the
+# unused registers gets the affected block split back at its gaps.
+MAX_REGISTER_GAP: Final = 8
+
+# Modbus exception code for a read touching an unimplemented address.
+_ILLEGAL_DATA_ADDRESS: Final = 2
+
+# Keyword names pymodbus has used for the unit/device id over its releases,
+# newest first.
+UNIT_KEYWORDS: Final = ("device_id", "unit", "slave")
+
+# Client method reading each register type.
+READ_METHODS: Final[dict[REGISTER_TYPE, str]] = {
+    "holding": "read_holding_registers",
+    "input": "read_input_registers",
+}
+
+# Marks a client method that takes the unit id as a trailing positional
+# argument (very old pymodbus) in the unit keyword cache.
+_POSITIONAL_UNIT: Final = ""
+
+# Failed attempts (of any kind) after which the retry loop drops the
+# connection even though no error pointed at the connection itself.
+RECONNECT_AFTER_FAILURES: Final = 3
+
 # Lower bound for the life-bit polling window. Guards against a 0/garbage
 # value in the failsafe-timeout register turning the loop into a tight
 # read/write spin that would hammer the wallbox and starve the data poll.
@@ -41,11 +73,34 @@ LIFE_BIT_MIN_INTERVAL: Final = 10
 LIFE_BIT_BACKOFF_MIN: Final = 5.0
 LIFE_BIT_BACKOFF_MAX: Final = 300.0
 
+# Interval bounds (seconds) for checking whether the wallbox cleared the life
+# bit. The check starts fast, since the bit usually clears within seconds, and
+# backs off so a long failsafe window costs a handful of reads, not one per
+# second.
+LIFE_BIT_CLEAR_POLL_MIN: Final = 0.5
+LIFE_BIT_CLEAR_POLL_MAX: Final = 5.0
+
+# Default keep-alive window (seconds) while the failsafe timeout is unknown.
+LIFE_BIT_DEFAULT_WINDOW: Final = 60
+
+# How long (seconds) the life-bit loop reuses the failsafe timeout it read
+# instead of spending a Modbus round trip on it every keep-alive cycle. Writes
+# through the bridge invalidate it immediately.
+FAILSAFE_TIMEOUT_REFRESH: Final = 300.0
+
 
 class WebastoModbusError(Exception):
     """Raised when a Modbus communication error occurs."""
 
 
+class WebastoModbusConnectionError(WebastoModbusError):
+    """Raised when the connection to the wallbox itself failed.
+
+    Unlike a timed-out or garbled response, the socket is gone (refused,
+    reset, not connected), so the retry loop reconnects before trying again.
+    """
+
+
 class WebastoModbusDeviceError(WebastoModbusError):
     """Raised when the wallbox answered but returned a Modbus exception.
 
@@ -56,6 +111,13 @@ class WebastoModbusDeviceError(WebastoModbusError):
     """
 
 
+class _BulkReadAbandoned(WebastoModbusError):
+    """Set on a shared bulk read whose leading caller was cancelled.
+
+    Followers waiting on it start a read of their own instead.
+    """
+
+
 _MODBUS_EXCEPTION_NAMES: Final[dict[int, str]] = {
     1: "Illegal Function",
     2: "Illegal Data Address",
@@ -81,6 +143,28 @@ def _describe_modbus_response(response: Any) -> str:
     return repr(response)
 
 
+# Decoders read a register layout straight out of a block's big-endian payload
+# at a register offset, so fields of a merged block need no per-field slice or
+# re-pack of the response.
+type _Decoder = Callable[[bytes, int], float | int | str]
+
+# Turns a raw value unpacked by a block layout (int, or bytes for strings) into
+# the field value; None when the raw value is already final.
+type _Converter = Callable[[Any], float | int | str]
+
+
+@dataclass(slots=True, frozen=True)
+class ReadField:
+    """A register slot in a read request, decoded once for every key sharing it."""
+
+    definition: RegisterDefinition
+    keys: tuple[str, ...]
+    offset: int  # position of the field's first register in the block response
+    end: int  # offset just past the field's last register
+    decode: _Decoder
+    convert: _Converter | None
+
+
 @dataclass(slots=True, frozen=True)
 class ReadRequest:
     """Aggregate multiple register definitions into a single Modbus read call."""
@@ -89,13 +173,100 @@ class ReadRequest:
     count: int
     register_type: REGISTER_TYPE
     registers: tuple[RegisterDefinition, ...]
-
-
-def _build_read_plan(definitions: Iterable[RegisterDefinition]) -> tuple[ReadRequest, ...]:
+    fields: tuple[ReadField, ...]
+    optional: bool  # every register is optional, so the block may be dropped
+    # Unpacks every field of a complete response in one call, in field order;
+    # None when fields overlap and can't share one struct format.
+    layout: Struct | None
+
+
+def _build_read_fields(
+    start_address: int,
+    registers: Iterable[RegisterDefinition],
+) -> tuple[ReadField, ...]:
+    """Collapse definitions that decode the exact same registers into one field."""
+
+    slots: dict[tuple[Any, ...], list[RegisterDefinition]] = {}
+    for definition in registers:
+        slot = (
+            definition.address,
+            definition.count,
+            definition.data_type,
+            definition.scale,
+            definition.encoding,
+        )
+        slots.setdefault(slot, []).append(definition)
+    fields: list[ReadField] = []
+    for members in slots.values():
+        definition = members[0]
+        offset = definition.address - start_address
+        fields.append(
+            ReadField(
+                definition=definition,
+                keys=tuple(member.key for member in members),
+                offset=offset,
+                end=offset + definition.count,
+                decode=_decoder_for(definition),
+                convert=_converter_for(definition),
+            )
+        )
+    fields.sort(key=lambda field: field.offset)
+    return tuple(fields)
+
+
+def _build_block_layout(fields: tuple[ReadField, ...]) -> Struct | None:
+    """Return one struct unpacking every field of a block, skipping gaps."""
+
+    codes: list[str] = []
+    position = 0
+    for field in fields:
+        definition = field.definition
+        if field.offset < position:
+            return None
+        if field.offset > position:
+            codes.append(f"{2 * (field.offset - position)}x")
+        if definition.data_type == "string":
+            codes.append(f"{2 * definition.count}s")
+        else:
+            code, size = ("I", 2) if definition.data_type == "uint32" else ("H", 1)
+            codes.append(code)
+            if definition.count > size:
+                codes.append(f"{2 * (definition.count - size)}x")
+        position = field.end
+    return _compiled_struct(">" + "".join(codes))
+
+
+def _make_read_request(
+    register_type: REGISTER_TYPE,
+    start_address: int,
+    end_address: int,
+    registers: list[RegisterDefinition],
+) -> ReadRequest:
+    fields = _build_read_fields(start_address, registers)
+    return ReadRequest(
+        start_address=start_address,
+        count=end_address - start_address,
+        register_type=register_type,
+        registers=tuple(registers),
+        fields=fields,
+        optional=all(definition.optional for definition in registers),
+        layout=_build_block_layout(fields),
+    )
+
+
+def _build_read_plan(
+    definitions: Iterable[RegisterDefinition],
+    max_gap: int = MAX_REGISTER_GAP,
+) -> tuple[ReadRequest, ...]:
     """Build efficient read requests from register definitions.
 
-    Registers are grouped by type (input/holding) and merged while they remain
-    contiguous and fit into the maximum register count supported by the EVSE.
+    Registers are grouped by type (input/holding) and merged while the gap to
+    the previous register is at most ``max_gap`` and the block fits
+    into the maximum register count supported by the EVSE. Optional registers
+    are never merged with required ones, so a firmware that lacks them only
+    loses its own (droppable) block. Definitions that share the exact same
+    registers and decoding are read and decoded once, then fanned out to every
+    key.
     """
 
     requests: list[ReadRequest] = []
@@ -112,6 +283,7 @@ def _build_read_plan(definitions: Iterable[RegisterDefinition]) -> tuple[ReadReq
         current_regs: list[RegisterDefinition] = []
         current_start: int | None = None
         current_end: int | None = None
+        current_optional = False
 
         for definition in items:
             reg_start = definition.address
@@ -120,41 +292,65 @@ def _build_read_plan(definitions: Iterable[RegisterDefinition]) -> tuple[ReadReq
             if (
                 current_start is None
                 or current_end is None
-                or reg_start >= current_end
+                or reg_start - current_end > max_gap
                 or reg_end - current_start > MAX_REGISTERS_PER_REQUEST
+                or definition.optional != current_optional
             ):
                 if current_regs:
                     assert current_start is not None
                     assert current_end is not None
                     requests.append(
-                        ReadRequest(
-                            start_address=current_start,
-                            count=current_end - current_start,
-                            register_type=register_type,
-                            registers=tuple(current_regs),
-                        )
+                        _make_read_request(register_type, current_start, current_end, current_regs)
                     )
                 current_regs = [definition]
                 current_start = reg_start
                 current_end = reg_end
+                current_optional = definition.optional
             else:
                 current_regs.append(definition)
                 current_end = max(current_end, reg_end)
 
         if current_regs and current_start is not None and current_end is not None:
             requests.append(
-                ReadRequest(
-                    start_address=current_start,
-                    count=current_end - current_start,
-                    register_type=register_type,
-                    registers=tuple(current_regs),
-                )
+                _make_read_request(register_type, current_start, current_end, current_regs)
             )
 
     requests.sort(key=lambda request: (request.register_type, request.start_address))
     return tuple(requests)
 
 
+# Read plans of the static register tables, keyed by the identity of the
+# definitions tuple (definitions are unhashable). The tuple is stored with its
+# plans so the id cannot be recycled while the entry exists. Bounded, since
+# callers may also pass ad-hoc tables.
+_READ_PLAN_CACHE_SIZE: Final = 8
+_READ_PLANS: dict[
+    int,
+    tuple[tuple[RegisterDefinition, ...], tuple[ReadRequest, ...], tuple[ReadRequest, ...]],
+] = {}
+
+
+def _read_plans_for(
+    registers: tuple[RegisterDefinition, ...],
+) -> tuple[tuple[ReadRequest, ...], tuple[ReadRequest, ...]]:
+    """Return the (holding, input) read plans for a register table.
+
+    The tables from ``get_readable_registers`` are built once at import, so
+    their plans are built (and sorted) once per process instead of per bridge.
+    """
+
+    cached = _READ_PLANS.get(id(registers))
+    if cached is not None and cached[0] is registers:
+        return cached[1], cached[2]
+    read_plan = _build_read_plan(registers)
+    holding_plan = tuple(request for request in read_plan if request.register_type == "holding")
+    input_plan = tuple(request for request in read_plan if request.register_type == "input")
+    if len(_READ_PLANS) >= _READ_PLAN_CACHE_SIZE:
+        del _READ_PLANS[next(iter(_READ_PLANS))]
+    _READ_PLANS[id(registers)] = (registers, holding_plan, input_plan)
+    return holding_plan, input_plan
+
+
 def _ensure_pymodbus() -> tuple[type[Any], type[Exception]]:
     """Ensure pymodbus is imported and return the relevant classes."""
 
@@ -188,14 +384,30 @@ class ModbusBridge:
         self._unit_id = unit_id
         self._timeout = read_timeout
         self._client_cls = client_cls
+        # pymodbus' close() is synchronous, the simulator's (and some older
+        # clients') is a coroutine. Decide once instead of on every close.
+        self._close_is_coroutine = inspect.iscoroutinefunction(getattr(client_cls, "close", None))
         self._modbus_exception = exception_cls
         self._client: Any | None = None
+        self._failures_since_reconnect = 0
+        self._pending_bulk_read: asyncio.Future[dict[str, float | int | str | None]] | None = None
+        # Unit keyword accepted by each client method, keyed by method name
+        # (_POSITIONAL_UNIT for methods taking the unit id positionally).
+        # Resolved from the client class up front; only methods whose
+        # signature hides the keyword (**kwargs) are probed on first use.
+        self._unit_keywords: dict[str, str] = _client_unit_keywords(client_cls)
         self._lock = asyncio.Lock()
         self._readable_registers: tuple[RegisterDefinition, ...] = (
             tuple(registers) if registers is not None else get_readable_registers()
         )
-        self._read_plan: tuple[ReadRequest, ...] = _build_read_plan(self._readable_registers)
+        # One plan per register type so the bulk read can call the matching
+        # client method directly instead of branching per block.
+        self._holding_plan: tuple[ReadRequest, ...]
+        self._input_plan: tuple[ReadRequest, ...]
+        self._holding_plan, self._input_plan = _read_plans_for(self._readable_registers)
         self._life_bit_task: asyncio.Task[None] | None = None
+        # (loop time of the read, keep-alive window) for the life-bit loop.
+        self._life_bit_window: tuple[float, int] | None = None
 
     async def start_life_bit_loop(self) -> None:
         """Start the background life bit loop."""
@@ -228,21 +440,16 @@ class ModbusBridge:
         slow boot doesn't flood the log — until an operation finally succeeds.
         """
         life_bit_reg = get_register("send_keepalive")
-        timeout_reg = get_register("failsafe_timeout_s")
 
         backoff = LIFE_BIT_BACKOFF_MIN
         warned = False
+        # The event loop's monotonic clock: a wall-clock step (NTP, DST) must
+        # neither cut a keep-alive window short nor stretch it.
+        loop = asyncio.get_running_loop()
 
         while True:
             try:
-                poll_timeout = 60  # default keep-alive window
-                try:
-                    val = await self.async_read_register(timeout_reg)
-                    if isinstance(val, (int, float)):
-                        poll_timeout = max(int(val), LIFE_BIT_MIN_INTERVAL)
-                except WebastoModbusDeviceError:
-                    pass  # quirk reading @2002; use the default window, still try the write
-                # Transport errors here propagate to the handler below.
+                poll_timeout = await self._async_life_bit_window()
 
                 await self.async_write_register(life_bit_reg, 1)
 
@@ -252,12 +459,13 @@ class ModbusBridge:
                     warned = False
                 backoff = LIFE_BIT_BACKOFF_MIN
 
-                start_time = time.time()
+                start_time = loop.time()
                 read_failed = False
-                while time.time() - start_time < poll_timeout:
+                clear_poll = LIFE_BIT_CLEAR_POLL_MIN
+                while (remaining := poll_timeout - (loop.time() - start_time)) > 0:
                     try:
                         if await self.async_read_register(life_bit_reg) == 0:
-                            _LOGGER.debug("Life bit cleared after %.2f s", time.time() - start_time)
+                            _LOGGER.debug("Life bit cleared after %.2f s", loop.time() - start_time)
                             break
                     except WebastoModbusError:
                         # Reading the life-bit register failed (rare: writes work
@@ -265,7 +473,8 @@ class ModbusBridge:
                         # below keeps this from becoming a tight write loop.
                         read_failed = True
                         break
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(min(clear_poll, remaining))
+                    clear_poll = min(clear_poll * 2, LIFE_BIT_CLEAR_POLL_MAX)
 
                 # Floor between keep-alive cycles so a fast-clearing life bit
                 # (or a register we can't read back) can't turn this into a
@@ -285,6 +494,26 @@ class ModbusBridge:
                 await asyncio.sleep(backoff)
                 backoff = min(backoff * 2, LIFE_BIT_BACKOFF_MAX)
 
+    async def _async_life_bit_window(self) -> int:
+        """Return the keep-alive window, re-reading the failsafe timeout only when stale."""
+
+        now = asyncio.get_running_loop().time()
+        cached = self._life_bit_window
+        if cached is not None and now - cached[0] < FAILSAFE_TIMEOUT_REFRESH:
+            return cached[1]
+
+        try:
+            val = await self.async_read_register(get_register("failsafe_timeout_s"))
+        except WebastoModbusDeviceError:
+            # Quirk reading @2002; use the default window, still try the write.
+            return LIFE_BIT_DEFAULT_WINDOW
+        # Transport errors propagate to the life-bit loop's handler.
+        if not isinstance(val, (int, float)):
+            return LIFE_BIT_DEFAULT_WINDOW
+        window = max(int(val), LIFE_BIT_MIN_INTERVAL)
+        self._life_bit_window = (now, window)
+        return window
+
     async def _invoke_with_unit(
         self,
         method: Callable[..., Awaitable[Any]],
@@ -293,28 +522,54 @@ class ModbusBridge:
     ) -> Any:
         """Call a pymodbus coroutine, handling differing device_id keyword names."""
 
-        base_kwargs = dict(kwargs)
-        for keyword in ("device_id", "unit", "slave"):
-            current_kwargs = dict(base_kwargs)
-            if keyword in current_kwargs:
+        # pymodbus renamed the unit keyword twice (slave -> device_id, with
+        # unit in between). Resolve it once per client method instead of
+        # probing with failing calls on every request.
+        name = getattr(method, "__name__", "")
+        keyword = self._unit_keywords.get(name)
+        if keyword is None:
+            keyword = _signature_unit_keyword(method)
+            if keyword is not None:
+                self._unit_keywords[name] = keyword
+        if keyword == _POSITIONAL_UNIT:
+            if not kwargs:
+                try:
+                    return await method(*args, self._unit_id)
+                except TypeError as err:
+                    raise WebastoModbusError(str(err)) from err
+        elif keyword is not None and keyword not in kwargs:
+            # kwargs is already this call's own dict; add the unit in place.
+            kwargs[keyword] = self._unit_id
+            try:
+                return await method(*args, **kwargs)
+            except TypeError as err:
+                raise WebastoModbusError(str(err)) from err
+
+        for keyword in UNIT_KEYWORDS:
+            if keyword in kwargs:
                 continue
-            current_kwargs[keyword] = self._unit_id
+            kwargs[keyword] = self._unit_id
             try:
-                return await method(*args, **current_kwargs)
+                result = await method(*args, **kwargs)
             except TypeError as err_keyword:
+                del kwargs[keyword]
                 if self._is_keyword_unsupported(err_keyword, keyword):
                     continue
                 raise WebastoModbusError(str(err_keyword)) from err_keyword
+            self._unit_keywords[name] = keyword
+            return result
 
-        if not base_kwargs:
+        if not kwargs:
             try:
-                return await method(*args, self._unit_id)
+                result = await method(*args, self._unit_id)
             except TypeError as err_positional:
                 if self._is_positional_only_error(err_positional):
                     raise WebastoModbusError(
                         "Modbus client does not support device_id/unit/slave parameter"
                     ) from err_positional
                 raise WebastoModbusError(str(err_positional)) from err_positional
+            self._unit_keywords[name] = _POSITIONAL_UNIT
+            return result
 
         raise WebastoModbusError("Modbus client does not support device_id/unit/slave parameter")
 
@@ -351,9 +606,7 @@ class ModbusBridge:
             try:
                 old_client = self._client
                 self._client = None
-                close_result = old_client.close()
-                if inspect.isawaitable(close_result):
-                    await asyncio.wait_for(close_result, timeout=2.0)
+                await self._async_close_client(old_client, close_timeout=2.0)
             except Exception as err:
                 _LOGGER.debug("Error closing stale client: %s", err)
 
@@ -381,14 +634,16 @@ class ModbusBridge:
                 client.close()
             except Exception:
                 pass
-            raise WebastoModbusError(f"Connection to {self._host}:{self._port} timed out") from err
+            raise WebastoModbusConnectionError(
+                f"Connection to {self._host}:{self._port} timed out"
+            ) from err
         except (OSError, self._modbus_exception) as err:
             # Ensure client is closed on error
             try:
                 client.close()
             except Exception:
                 pass
-            raise WebastoModbusError(
+            raise WebastoModbusConnectionError(
                 f"Failed to connect to {self._host}:{self._port}: {err}"
             ) from err
 
@@ -397,10 +652,13 @@ class ModbusBridge:
                 client.close()
             except Exception:
                 pass
-            raise WebastoModbusError(
+            raise WebastoModbusConnectionError(
                 f"Unable to connect to {self._host}:{self._port} (device_id {self._unit_id})"
             )
+        _configure_socket(client)
         self._client = client
+        # Failures counted against the previous socket say nothing about this one.
+        self._failures_since_reconnect = 0
         _LOGGER.debug("Modbus connection established to %s:%s", self._host, self._port)
 
     async def async_close(self) -> None:
@@ -416,18 +674,37 @@ class ModbusBridge:
             _LOGGER.warning("Could not acquire lock for close, forcing close for %s", self._host)
             client = self._client
             self._client = None
+        self._failures_since_reconnect = 0
 
         if client is not None:
             try:
-                close_result = client.close()
-                if inspect.isawaitable(close_result):
-                    await asyncio.wait_for(close_result, timeout=3.0)
+                await self._async_close_client(client, close_timeout=3.0)
             except TimeoutError:
                 _LOGGER.warning("Modbus close timed out for %s", self._host)
             except Exception as err:
                 _LOGGER.warning("Error closing Modbus connection: %s", err)
             _LOGGER.debug("Modbus connection to %s closed", self._host)
 
+    def _map_client_error(self, err: Exception) -> WebastoModbusError:
+        """Wrap a client exception, discarding the client if the link is gone.
+
+        Must be called with the lock held.
+        """
+
+        if _is_connection_error(err):
+            # Mark client as disconnected to force reconnect on next attempt
+            self._client = None
+            return WebastoModbusConnectionError(str(err))
+        return WebastoModbusError(str(err))
+
+    async def _async_close_client(self, client: Any, close_timeout: float) -> None:
+        """Close a client, awaiting it only if the client class needs that."""
+
+        if self._close_is_coroutine:
+            await asyncio.wait_for(client.close(), timeout=close_timeout)
+        else:
+            client.close()
+
     async def async_test_connection(self) -> None:
         """Perform a lightweight read to validate the connection."""
 
@@ -444,9 +721,37 @@ class ModbusBridge:
         )
 
     async def async_read_data(self) -> dict[str, float | int | str | None]:
-        """Read all relevant registers and return a dictionary."""
+        """Read all relevant registers and return a dictionary.
+
+        Concurrent callers share the bulk read already in flight instead of
+        queueing an identical one behind the lock.
+        """
 
-        return await self._call_with_retry(self._async_read_data_once, "bulk read")
+        while (pending := self._pending_bulk_read) is not None:
+            try:
+                # Shielded: a cancelled follower must not cancel the shared read.
+                return await asyncio.shield(pending)
+            except _BulkReadAbandoned:
+                # The caller that started the read was cancelled, not us.
+                continue
+
+        future: asyncio.Future[dict[str, float | int | str | None]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        future.add_done_callback(_retrieve_exception)
+        self._pending_bulk_read = future
+        try:
+            data = await self._call_with_retry(self._async_read_data_once, "bulk read")
+        except asyncio.CancelledError:
+            future.set_exception(_BulkReadAbandoned("bulk read cancelled"))
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        finally:
+            self._pending_bulk_read = None
+        future.set_result(data)
+        return data
 
     async def async_write_register(self, register: RegisterDefinition, value: int) -> None:
         """Write a single holding register."""
@@ -458,6 +763,8 @@ class ModbusBridge:
             lambda: self._async_write_register_once(register, value),
             f"write register {register.key}",
         )
+        if register.key == "failsafe_timeout_s":
+            self._life_bit_window = None
 
     async def _call_with_retry(
         self,
@@ -467,7 +774,7 @@ class ModbusBridge:
         last_err: WebastoModbusError | None = None
         for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
             try:
-                return await func()
+                result = await func()
             except asyncio.CancelledError:
                 # Re-raise cancellation immediately to allow clean shutdown
                 raise
@@ -487,10 +794,21 @@ class ModbusBridge:
                     description,
                     err,
                 )
-                await self.async_close()
+                # A timed-out or garbled response doesn't mean the socket is
+                # dead; keep it for the next attempt unless the connection
+                # itself failed or failures keep piling up regardless.
+                self._failures_since_reconnect += 1
+                if (
+                    isinstance(err, WebastoModbusConnectionError)
+                    or self._failures_since_reconnect >= RECONNECT_AFTER_FAILURES
+                ):
+                    await self.async_close()
                 if attempt == MAX_RETRY_ATTEMPTS:
                     break
                 await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+            else:
+                self._failures_since_reconnect = 0
+                return result
         assert last_err is not None
         raise last_err
 
@@ -498,120 +816,225 @@ class ModbusBridge:
         self,
         register: RegisterDefinition,
     ) -> int | float | str | None:
-        modbus_exception = self._modbus_exception
         async with self._lock:
             await self.async_connect()
             assert self._client is not None  # For type checkers
 
             try:
-                if register.register_type == "input":
-                    response = await self._invoke_with_unit(
-                        self._client.read_input_registers,
-                        register.address,
-                        count=register.count,
-                    )
-                else:
-                    response = await self._invoke_with_unit(
-                        self._client.read_holding_registers,
-                        register.address,
-                        count=register.count,
-                    )
-            except (modbus_exception, OSError, ConnectionError) as err:
-                # Mark client as disconnected to force reconnect on next attempt
-                self._client = None
-                raise WebastoModbusError(str(err)) from err
+                response = await self._invoke_with_unit(
+                    getattr(self._client, READ_METHODS[register.register_type]),
+                    register.address,
+                    count=register.count,
+                )
+            except (self._modbus_exception, OSError) as err:
+                raise self._map_client_error(err) from err
 
-        if not hasattr(response, "isError") or response.isError():
+        if response.isError():
             raise WebastoModbusDeviceError(
                 f"reading {register.key} (@{register.address}) failed: "
                 f"{_describe_modbus_response(response)}"
             )
 
-        return _decode_register(register, response.registers)
+        registers = response.registers
+        if len(registers) != register.count:
+            raise WebastoModbusDeviceError(
+                f"reading {register.key} (@{register.address}) returned "
+                f"{len(registers)} registers, expected {register.count}"
+            )
+        return _decode_register(register, registers)
 
     async def _async_read_data_once(self) -> dict[str, float | int | str | None]:
         data: dict[str, float | int | str | None] = {}
-        modbus_exception = self._modbus_exception
 
+        # Only the Modbus exchanges need the lock; decoding and plan updates
+        # happen after it is released so the life-bit loop isn't kept waiting
+        # on pure CPU work.
         async with self._lock:
             await self.async_connect()
             assert self._client is not None
 
-            read_any = False
-            for request in self._read_plan:
-                try:
-                    if request.register_type == "input":
-                        response = await self._invoke_with_unit(
-                            self._client.read_input_registers,
-                            request.start_address,
-                            count=request.count,
-                        )
-                    else:
-                        response = await self._invoke_with_unit(
-                            self._client.read_holding_registers,
-                            request.start_address,
-                            count=request.count,
-                        )
-                except (modbus_exception, OSError, ConnectionError) as err:
-                    # Mark client as disconnected to force reconnect on next attempt
-                    self._client = None
-                    raise WebastoModbusError(str(err)) from err
-
-                if response.isError():
-                    detail = _describe_modbus_response(response)
-                    if not read_any:
-                        # The first (core) block came back as an error: the
-                        # wallbox is offline or still booting. Don't bother with
-                        # the remaining blocks (they'll fail too) and let the
-                        # coordinator emit a single "not responding" log line.
-                        raise WebastoModbusDeviceError(
-                            f"wallbox not responding (read @{request.start_address} "
-                            f"returned {detail})"
-                        )
-                    # A later block failed while others worked -> likely a
-                    # register this firmware doesn't implement.
-                    if all(reg.optional for reg in request.registers):
-                        _LOGGER.info(
-                            "Removing optional register block @%s from read plan "
-                            "(not supported by this wallbox: %s)",
-                            request.start_address,
-                            detail,
-                        )
-                        self._read_plan = tuple(
-                            r for r in self._read_plan if r.start_address != request.start_address
-                        )
-                    else:
-                        _LOGGER.warning(
-                            "Modbus error reading block @%s (%s): %s",
-                            request.start_address,
-                            request.count,
-                            detail,
-                        )
-                    for definition in request.registers:
-                        data[definition.key] = None
-                    continue
+            client = self._client
+            # Holding blocks first: the first block read doubles as the
+            # "is the wallbox answering at all" probe (see below).
+            blocks = [
+                *((client.read_holding_registers, request) for request in self._holding_plan),
+                *((client.read_input_registers, request) for request in self._input_plan),
+            ]
+            if not blocks:
+                return data
+
+            read_method, first_request = blocks[0]
+            first_response, first_runs = await self._async_read_plan_block(
+                read_method, first_request
+            )
+            first_failed = first_response.isError() and first_runs is None
+            if not first_failed:
+                remaining = blocks[1:]
+                # Read one block after another: the bridge owns a single TCP
+                # connection, and pymodbus >= 3.11 serialises the requests of
+                # a client in its transaction manager, so gathering the reads
+                # would only add task overhead without overlapping any RTTs.
+                results = [
+                    await self._async_read_plan_block(method, request)
+                    for method, request in remaining
+                ]
+
+        if first_failed:
+            # The first (core) block came back as an error: the wallbox is
+            # offline or still booting. Don't bother with the remaining
+            # blocks (they'll fail too) and let the coordinator emit a
+            # single "not responding" log line.
+            raise WebastoModbusDeviceError(
+                f"wallbox not responding (read @{first_request.start_address} "
+                f"returned {_describe_modbus_response(first_response)})"
+            )
 
-                read_any = True
-                registers = response.registers
-                for definition in request.registers:
-                    offset = definition.address - request.start_address
-                    slice_end = offset + definition.count
-                    register_values = registers[offset:slice_end]
-                    if len(register_values) != definition.count:
-                        _LOGGER.warning(
-                            "Received %s values for %s, expected %s",
-                            len(register_values),
-                            definition.key,
-                            definition.count,
-                        )
-                        data[definition.key] = None
-                        continue
-                    data[definition.key] = _decode_register(definition, register_values)
+        replacements: list[tuple[ReadRequest, tuple[ReadRequest, ...]]] = []
+        for request, (response, runs) in zip(
+            (first_request, *(request for _, request in remaining)),
+            ((first_response, first_runs), *results),
+            strict=True,
+        ):
+            if runs is not None:
+                # The block only works without its gap registers: read its
+                # runs from now on.
+                for run, run_response in runs:
+                    _decode_block(run, run_response.registers, data)
+                replacements.append((request, tuple(run for run, _ in runs)))
+            elif response.isError():
+                replacement = self._handle_block_error(request, response, data)
+                if replacement is not None:
+                    replacements.append((request, replacement))
+            else:
+                _decode_block(request, response.registers, data)
+        if replacements:
+            self._replace_read_requests(replacements)
 
         return data
 
+    async def _async_read_block(
+        self,
+        read_method: Callable[..., Awaitable[Any]],
+        request: ReadRequest,
+    ) -> Any:
+        """Read a single plan block, mapping transport errors."""
+
+        try:
+            return await self._invoke_with_unit(
+                read_method,
+                request.start_address,
+                count=request.count,
+            )
+        except (self._modbus_exception, OSError) as err:
+            raise self._map_client_error(err) from err
+
+    async def _async_read_plan_block(
+        self,
+        read_method: Callable[..., Awaitable[Any]],
+        request: ReadRequest,
+    ) -> tuple[Any, tuple[tuple[ReadRequest, Any], ...] | None]:
+        """Read a plan block, falling back to its runs if its gaps are refused.
+
+        Returns the block's response and, when the wallbox refused only the
+        bridged gap registers and every contiguous run read fine, the runs
+        with their responses. Otherwise the runs are None and the read plan is
+        left alone, so a transient refusal (e.g. while the wallbox boots)
+        doesn't split the block for good.
+        """
+
+        response = await self._async_read_block(read_method, request)
+        if not response.isError():
+            return response, None
+        split = self._split_rejected_block(request, response)
+        if split is None:
+            return response, None
+        runs: list[tuple[ReadRequest, Any]] = []
+        for run in split:
+            run_response = await self._async_read_block(read_method, run)
+            if run_response.isError():
+                return response, None
+            runs.append((run, run_response))
+        _LOGGER.info(
+            "Splitting register block @%s (%s) into %s blocks "
+            "(gap registers rejected by this wallbox: %s)",
+            request.start_address,
+            request.count,
+            len(split),
+            _describe_modbus_response(response),
+        )
+        return response, tuple(runs)
+
+    def _handle_block_error(
+        self,
+        request: ReadRequest,
+        response: Any,
+        data: dict[str, float | int | str | None],
+    ) -> tuple[ReadRequest, ...] | None:
+        """Blank out a failed block; return its plan replacement, if any.
+
+        An empty replacement removes the block from the plan, None keeps it.
+        """
+
+        for definition in request.registers:
+            data[definition.key] = None
+        detail = _describe_modbus_response(response)
+        # A later block failed while others worked -> likely a register this
+        # firmware doesn't implement.
+        if request.optional:
+            _LOGGER.info(
+                "Removing optional register block @%s from read plan "
+                "(not supported by this wallbox: %s)",
+                request.start_address,
+                detail,
+            )
+            return ()
+        _LOGGER.warning(
+            "Modbus error reading block @%s (%s): %s",
+            request.start_address,
+            request.count,
+            detail,
+        )
+        return None
+
+    @staticmethod
+    def _split_rejected_block(
+        request: ReadRequest, response: Any
+    ) -> tuple[ReadRequest, ...] | None:
+        """Return a block's contiguous runs if the wallbox refused its gap registers.
+
+        A merged block bridges unused registers; a firmware that refuses to
+        serve them answers Illegal Data Address for the whole block. None if
+        the error has another cause or the block has no gaps to drop.
+        """
+
+        if getattr(response, "exception_code", None) != _ILLEGAL_DATA_ADDRESS:
+            return None
+        split = _build_read_plan(request.registers, max_gap=0)
+        return split if len(split) > 1 else None
+
+    def _replace_read_requests(
+        self,
+        replacements: list[tuple[ReadRequest, tuple[ReadRequest, ...]]],
+    ) -> None:
+        """Swap blocks in the read plans for their replacements, rebuilding each plan once."""
+
+        def _rebuild(plan: tuple[ReadRequest, ...]) -> tuple[ReadRequest, ...]:
+            rebuilt: list[ReadRequest] = []
+            for request in plan:
+                for old, new in replacements:
+                    if request == old:
+                        rebuilt.extend(new)
+                        break
+                else:
+                    rebuilt.append(request)
+            return tuple(rebuilt)
+
+        if any(old.register_type == "holding" for old, _ in replacements):
+            self._holding_plan = _rebuild(self._holding_plan)
+        if any(old.register_type == "input" for old, _ in replacements):
+            self._input_plan = _rebuild(self._input_plan)
+
     async def _async_write_register_once(self, register: RegisterDefinition, value: int) -> None:
-        modbus_exception = self._modbus_exception
         async with self._lock:
             await self.async_connect()
             assert self._client is not None
@@ -622,10 +1045,8 @@ class ModbusBridge:
                     register.address,
                     value,
                 )
-            except (modbus_exception, OSError, ConnectionError) as err:
-                # Mark client as disconnected to force reconnect on next attempt
-                self._client = None
-                raise WebastoModbusError(str(err)) from err
+            except (self._modbus_exception, OSError) as err:
+                raise self._map_client_error(err) from err
 
         if response.isError():
             raise WebastoModbusDeviceError(
@@ -652,29 +1073,208 @@ class ModbusBridge:
         return f"{self._host}:{self._port} (device_id {self._unit_id})"
 
 
-def _decode_register(definition: RegisterDefinition, data: list[int]) -> float | int | str:
-    """Decode a Modbus response into a Python value."""
+@cache
+def _register_struct(count: int) -> Struct:
+    """Return a compiled big-endian struct packing ``count`` 16-bit registers."""
+
+    return Struct(f">{count}H")
+
 
+def _configure_socket(client: Any) -> None:
+    """Tune the client's TCP socket for small, latency-sensitive exchanges.
+
+    Disables Nagle's algorithm (asyncio's own transports already do, other
+    event loops may not) and enables TCP keep-alive so a silently dropped
+    long-lived connection is noticed. pymodbus exposes the transport on the
+    client or its ``ctx``/``protocol`` depending on the version; clients
+    without one (like the simulator) are left alone.
+    """
+
+    for owner in (client, getattr(client, "ctx", None), getattr(client, "protocol", None)):
+        transport = getattr(owner, "transport", None)
+        if transport is not None:
+            break
+    else:
+        return
+    get_extra_info = getattr(transport, "get_extra_info", None)
+    sock = get_extra_info("socket") if get_extra_info is not None else None
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError as err:
+        _LOGGER.debug("Could not tune Modbus socket options: %s", err)
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    """Mark a shared future's exception as retrieved when nobody else awaited it."""
+
+    if not future.cancelled():
+        future.exception()
+
+
+def _is_connection_error(err: Exception) -> bool:
+    """Return True if ``err`` means the connection itself is unusable."""
+
+    if isinstance(err, TimeoutError):
+        return False
+    if isinstance(err, OSError):
+        return True
+    return _ConnectionException is not None and isinstance(err, _ConnectionException)
+
+
+def _signature_unit_keyword(method: Callable[..., Any]) -> str | None:
+    """Return the unit keyword named in ``method``'s signature, if any."""
+
+    try:
+        parameters = inspect.signature(method).parameters
+    except TypeError, ValueError:
+        return None
+    for keyword in UNIT_KEYWORDS:
+        if keyword in parameters:
+            return keyword
+    return None
+
+
+def _client_unit_keywords(client_cls: type[Any]) -> dict[str, str]:
+    """Return the unit keyword of each Modbus method the bridge calls on ``client_cls``."""
+
+    keywords: dict[str, str] = {}
+    for name in (*READ_METHODS.values(), "write_register"):
+        method = getattr(client_cls, name, None)
+        keyword = None if method is None else _signature_unit_keyword(method)
+        if keyword is not None:
+            keywords[name] = keyword
+    return keywords
+
+
+def _decode_block(
+    request: ReadRequest,
+    registers: list[int],
+    data: dict[str, float | int | str | None],
+) -> None:
+    """Decode every field of a block response into ``data``."""
+
+    received = len(registers)
+    # One C-level pack per block; every field then decodes with struct calls.
+    payload = _register_struct(received).pack(*registers)
+    value: float | int | str | None
+    layout = request.layout
+    if layout is not None and received >= request.count:
+        for field, raw in zip(request.fields, layout.unpack_from(payload), strict=True):
+            convert = field.convert
+            value = raw if convert is None else convert(raw)
+            for key in field.keys:
+                data[key] = value
+        return
+    for field in request.fields:
+        if field.end <= received:
+            value = field.decode(payload, field.offset)
+        else:
+            definition = field.definition
+            _LOGGER.warning(
+                "Received %s values for %s, expected %s",
+                max(received - field.offset, 0),
+                definition.key,
+                definition.count,
+            )
+            value = None
+        for key in field.keys:
+            data[key] = value
+
+
+def _decode_string(payload: bytes, offset: int, count: int, encoding: str) -> str:
+    start = 2 * offset
+    return _convert_string(payload[start : start + 2 * count], encoding)
+
+
+def _convert_string(raw: bytes, encoding: str) -> str:
+    byte_buffer = raw.rstrip(b"\x00")
+    if byte_buffer.isascii():
+        # Pure ASCII (the normal case for IDs) decodes identically under
+        # every supported encoding; latin-1 is a straight byte copy.
+        text = byte_buffer.decode("latin-1")
+    else:
+        text = byte_buffer.decode(encoding, errors="ignore")
+    return text.strip()
+
+
+_UINT16: Final = Struct(">H")
+_UINT32: Final = Struct(">I")
+
+
+def _decode_uint16(payload: bytes, offset: int) -> int:
+    return _UINT16.unpack_from(payload, 2 * offset)[0]
+
+
+def _decode_uint32(payload: bytes, offset: int) -> int:
+    return _UINT32.unpack_from(payload, 2 * offset)[0]
+
+
+@cache
+def _make_string_decoder(count: int, encoding: str) -> _Decoder:
+    """Return a decoder for a ``count``-register string."""
+
+    return partial(_decode_string, count=count, encoding=encoding)
+
+
+@cache
+def _make_decoder(data_type: str, scale: float) -> _Decoder:
+    """Return a decoder for one numeric register layout.
+
+    Shared by every definition with the same type and scale, so the per-value
+    work is a single call without re-dispatching on the data type.
+    """
+
+    # Specialise on (data_type, scale == 1) so no decoder calls another one.
+    # Unscaled registers are already ints, which keeps entity states clean.
+    if data_type == "uint16":
+        if scale == 1:
+            return _decode_uint16
+        unpack_uint16 = _UINT16.unpack_from
+        return lambda payload, offset: unpack_uint16(payload, 2 * offset)[0] * scale
+    if data_type == "uint32":
+        if scale == 1:
+            return _decode_uint32
+        unpack_uint32 = _UINT32.unpack_from
+        return lambda payload, offset: unpack_uint32(payload, 2 * offset)[0] * scale
+    raise ValueError(f"Unsupported data type: {data_type}")  # pragma: no cover
+
+
+@cache
+def _compiled_struct(fmt: str) -> Struct:
+    """Return a compiled struct, shared by every block with the same layout."""
+
+    return Struct(fmt)
+
+
+@cache
+def _make_converter(data_type: str, scale: float, encoding: str) -> _Converter | None:
+    """Return the converter finishing a raw value unpacked by a block layout."""
+
+    if data_type == "string":
+        return partial(_convert_string, encoding=encoding)
+    if scale == 1:
+        return None
+    return partial(mul, scale)
+
+
+def _converter_for(definition: RegisterDefinition) -> _Converter | None:
+    return _make_converter(definition.data_type, definition.scale, definition.encoding or "utf-8")
+
+
+def _decoder_for(definition: RegisterDefinition) -> _Decoder:
     if definition.data_type == "string":
-        byte_buffer = bytearray()
-        for register in data:
-            byte_buffer.extend(register.to_bytes(2, "big"))
-        byte_buffer = byte_buffer.rstrip(b"\x00")
-        text = byte_buffer.decode(
-            definition.encoding or "utf-8",
-            errors="ignore",
-        )
-        return text.strip()
-
-    if definition.data_type == "uint16":
-        raw_value = data[0]
-    elif definition.data_type == "uint32":
-        raw_value = (data[0] << 16) + data[1]
-    else:  # pragma: no cover - defensive fallback
-        raise ValueError(f"Unsupported data type: {definition.data_type}")
-
-    value = raw_value * definition.scale
-    if definition.scale == 1:
-        # Return integer for whole numbers to keep entity states clean.
-        return int(value)
-    return value
+        return _make_string_decoder(definition.count, definition.encoding or "utf-8")
+    return _make_decoder(definition.data_type, definition.scale)
+
+
+def _decode_register(definition: RegisterDefinition, data: list[int]) -> float | int | str:
+    """Decode a Modbus response into a Python value.
+
+    ``data`` must hold exactly ``definition.count`` registers.
+    """
+
+    payload = _register_struct(len(data)).pack(*data)
+    return _decoder_for(definition)(payload, 0)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import Final
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -12,7 +13,7 @@ from homeassistant.components.number import (
     RestoreNumber,
 )
 from homeassistant.const import CONF_HOST, PERCENTAGE, EntityCategory, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -23,9 +24,9 @@ from .const import (
     DOMAIN,
     MODEL_NEXT,
     MODEL_UNITE,
-    SIGNAL_REGISTER_WRITTEN,
     UNITE_RANDOMISED_DELAY_MAX,
     RegisterDefinition,
+    build_register_written_signal,
     get_number_registers,
 )
 from .coordinator import WebastoDataCoordinator
@@ -37,6 +38,9 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+# Current setpoints additionally capped by the configured variant's maximum.
+_CURRENT_LIMITED_KEYS: Final[frozenset[str]] = frozenset({"failsafe_current_a", "set_current_a"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -50,42 +54,24 @@ async def async_setup_entry(
     host = entry.data[CONF_HOST]
     unit_id = entry.data[CONF_UNIT_ID]
 
+    coordinator = runtime.coordinator
+    bridge = runtime.bridge
+    device_name = runtime.device_name
     max_current = runtime.max_current
+    model = runtime.model
     entities: list[NumberEntity] = [
-        WebastoNumber(
-            runtime.coordinator,
-            runtime.bridge,
-            host,
-            unit_id,
-            register,
-            runtime.device_name,
-            max_current,
-        )
-        for register in get_number_registers(runtime.model)
+        WebastoNumber(coordinator, bridge, host, unit_id, register, device_name, max_current)
+        for register in get_number_registers(model)
     ]
 
     # REST-backed number entities are model-specific: the Next exposes a 0-100
     # LED brightness; the Unite has no such field but exposes a randomised
     # start-delay (its LED control is an enum, handled by the select platform).
-    if runtime.coordinator.rest_enabled:
-        if runtime.model == MODEL_NEXT:
-            entities.append(
-                WebastoLedBrightness(
-                    runtime.coordinator,
-                    host,
-                    unit_id,
-                    runtime.device_name,
-                )
-            )
-        elif runtime.model == MODEL_UNITE:
-            entities.append(
-                WebastoRandomisedDelay(
-                    runtime.coordinator,
-                    host,
-                    unit_id,
-                    runtime.device_name,
-                )
-            )
+    if coordinator.rest_enabled:
+        if model == MODEL_NEXT:
+            entities.append(WebastoLedBrightness(coordinator, host, unit_id, device_name))
+        elif model == MODEL_UNITE:
+            entities.append(WebastoRandomisedDelay(coordinator, host, unit_id, device_name))
 
     async_add_entities(entities)
 
@@ -93,6 +79,19 @@ async def async_setup_entry(
 class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
     """Expose writable Modbus registers as number entities."""
 
+    # The HA entity bases are not slotted, so instances keep a ``__dict__``;
+    # the slots only cover this class' own state, read on every coordinator
+    # update. ``_attr_*`` stay class-level defaults for HA's cached properties.
+    __slots__ = (
+        "_ha_ready",
+        "_int_max",
+        "_int_min",
+        "_last_available",
+        "_last_written_value",
+        "_variant_max_current",
+        "_write_only",
+    )
+
     _attr_has_entity_name = True
     _attr_mode = NumberMode.BOX
 
@@ -108,16 +107,32 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
     ) -> None:
         super().__init__(coordinator, bridge, host, unit_id, register, device_name)
 
-        if register.min_value is not None:
-            self._attr_native_min_value = register.min_value
-        if register.max_value is not None:
-            self._attr_native_max_value = register.max_value
+        min_value = register.min_value
+        max_value = register.max_value
+        if variant_max_current is not None and register.key in _CURRENT_LIMITED_KEYS:
+            max_value = float(
+                variant_max_current if max_value is None else min(max_value, variant_max_current)
+            )
+        if min_value is not None:
+            self._attr_native_min_value = min_value
+        if max_value is not None:
+            self._attr_native_max_value = max_value
+        # Integer bounds for clamping writes; unbounded sides use sentinels
+        # outside any 32-bit register value so the clamp needs no None checks.
+        self._int_min = -(1 << 32) if min_value is None else int(min_value)
+        self._int_max = 1 << 32 if max_value is None else int(max_value)
         if register.step is not None:
             self._attr_native_step = register.step
         if register.unit:
             self._attr_native_unit_of_measurement = register.unit
 
         self._last_written_value: int | None = None
+        # Availability last written to the state machine; None until the
+        # first coordinator update so that one always writes.
+        self._last_available: bool | None = None
+        # True while the entity is added to hass, so state writes from service
+        # calls and background seeding only happen while they can land.
+        self._ha_ready = False
         self._write_only = register.write_only
         if self._write_only:
             self._attr_assumed_state = True
@@ -133,46 +148,51 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
                     self._last_written_value = None
 
         self._variant_max_current = variant_max_current
-        if (
-            register.key in {"failsafe_current_a", "set_current_a"}
-            and variant_max_current is not None
-        ):
-            current_max = self._attr_native_max_value
-            if current_max is None:
-                current_max = float(variant_max_current)
-            self._attr_native_max_value = float(min(current_max, variant_max_current))
 
     def _clamp_to_bounds(self, value: int) -> int:
         """Clamp an integer value to the entity's native min/max."""
 
-        if self._attr_native_min_value is not None:
-            value = max(value, int(self._attr_native_min_value))
-        if self._attr_native_max_value is not None:
-            value = min(value, int(self._attr_native_max_value))
-        return value
+        return min(self._int_max, max(self._int_min, value))
 
     async def async_set_native_value(self, value: float) -> None:
         """Write a value to the Modbus register."""
 
-        int_value = self._clamp_to_bounds(int(round(value)))
+        int_value = self._clamp_to_bounds(round(value))
         await self._async_write_register(int_value)
         self._last_written_value = int_value
         self._attr_native_value = int_value
-        if self.hass is not None:
+        if self._ha_ready:
             self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
+        # The new value is already shown; don't hold the caller for a full
+        # poll just to confirm it.
+        refresh = self.coordinator.async_request_refresh()
+        name = f"webasto_next_modbus refresh {self.entity_id}"
+        if self.coordinator.config_entry is not None:
+            self.coordinator.config_entry.async_create_background_task(
+                self.hass, refresh, name=name
+            )
+        else:
+            self.hass.async_create_background_task(refresh, name=name)
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Update the native value from coordinator data."""
 
         if self._write_only:
-            if self._last_written_value is not None:
-                self._attr_native_value = self._last_written_value
-            else:
-                self._attr_native_value = None
+            value = self._last_written_value
         else:
             value = self.get_coordinator_value()
-            self._attr_native_value = value
+        available = self.available
+        # Setpoints rarely move: skip the state write while neither the value,
+        # the availability nor the device info changed since the last one.
+        if (
+            value == self._attr_native_value
+            and available == self._last_available
+            and self._device_info_revision == self.coordinator.rest_revision
+        ):
+            return
+        self._last_available = available
+        self._attr_native_value = value
 
         super()._handle_coordinator_update()
 
@@ -180,6 +200,7 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
         """Restore the value and subscribe to dispatcher events."""
 
         await super().async_added_to_hass()
+        self._ha_ready = True
         if self._write_only:
             # Show the last value we know about immediately so the entity is
             # not blank, then refine it from the wallbox in the background. The
@@ -209,7 +230,7 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
             return
         remove = async_dispatcher_connect(
             self.hass,
-            SIGNAL_REGISTER_WRITTEN,
+            build_register_written_signal(self._unique_prefix, self.register.key),
             self._handle_register_written,
         )
         self.async_on_remove(remove)
@@ -227,11 +248,13 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
         if not (last_number_data and last_number_data.native_value is not None):
             return
         try:
-            restored_value = float(last_number_data.native_value)
+            restored_value = self._clamp_to_bounds(int(round(float(last_number_data.native_value))))
         except TypeError, ValueError:
             return
+        # Only the wallbox needs the value again: the entity already shows it
+        # (see async_added_to_hass) and the regular poll follows anyway.
         try:
-            await self.async_set_native_value(restored_value)
+            await self._async_write_register(restored_value)
         except HomeAssistantError as err:
             _LOGGER.warning(
                 "Failed to re-apply %s for %s: %s",
@@ -239,6 +262,8 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
                 self.entity_id,
                 err,
             )
+            return
+        self._last_written_value = restored_value
 
     async def _async_seed_from_wallbox(self) -> bool:
         """Seed the value from the wallbox's current register value.
@@ -256,35 +281,41 @@ class WebastoNumber(WebastoRegisterEntity, RestoreNumber, NumberEntity):
             return False
         if not isinstance(value, (int, float)):
             return False
-        int_value = self._clamp_to_bounds(int(round(value)))
-        self._last_written_value = int_value
-        self._attr_native_value = float(int_value)
-        if self.hass is not None:
-            self.async_write_ha_state()
+        self._async_show_register_value(self._clamp_to_bounds(int(round(value))))
         return True
 
-    def _handle_register_written(
-        self,
-        device_slug: str,
-        register_key: str,
-        value: int | float | None,
-    ) -> None:
+    @callback
+    def _handle_register_written(self, value: int | float | None) -> None:
         """Update entity state when a service writes to the backing register."""
 
-        if device_slug != self._unique_prefix or register_key != self.register.key:
-            return
-        if value is None:
-            int_value: int | None = None
+        # Services always send ints (or None); only other values need coercing.
+        int_value: int | None
+        if value is None or isinstance(value, int):
+            int_value = value
         else:
             try:
                 int_value = int(value)
             except TypeError, ValueError:
                 return
-        self._last_written_value = int_value
-        self._attr_native_value = int_value
-        if self.hass is not None:
+        self._async_show_register_value(int_value)
+
+    @callback
+    def _async_show_register_value(self, value: int | None) -> None:
+        """Record the register's current value; write state only if it changed."""
+
+        self._last_written_value = value
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        if self._ha_ready:
             self.async_write_ha_state()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop writing state once the entity is being removed."""
+
+        self._ha_ready = False
+        await super().async_will_remove_from_hass()
+
 
 class WebastoLedBrightness(WebastoRestEntity, NumberEntity):
     """Number entity for LED brightness via REST API."""
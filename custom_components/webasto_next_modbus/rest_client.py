@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
 import logging
+import random
+import re
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, TypeGuard
 
 import aiohttp
 
@@ -18,7 +23,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,11 +31,46 @@ _LOGGER = logging.getLogger(__name__)
 # Next's per-type values (see issue #97).
 _UNITE_UPDATE_TYPE: Final = "simple-configuration-field-update"
 
+# Signal voltages like "L1: 230.5", "L1:230,5V" or "L1 = 230.5 V"
+_SIGNAL_VOLTAGE_RE: Final = re.compile(r"L([123])\s*[:=]\s*([0-9]+(?:[\.,][0-9]+)?)", re.IGNORECASE)
+# IPv4 addresses in the wallbox's ifconfig-style interfaces dump
+_INET_RE: Final = re.compile(r"inet\s+(\d+\.\d+\.\d+\.\d+)")
+
+# Next system-section fieldKeys mapped to RestData attributes, taken verbatim
+# or converted to int. "interfaces" and "signal-voltage" need their own parsing.
+_SYSTEM_TEXT_FIELDS: Final = {
+    "comboard-sw-version": "comboard_sw_version",
+    "powerboard-sw-version": "powerboard_sw_version",
+    "comboard-hw-version": "comboard_hw_version",
+    "powerboard-hw-version": "powerboard_hw_version",
+    "MAC-Address Eth0": "mac_address_ethernet",
+    "MAC-Address WiFi": "mac_address_wifi",
+}
+_SYSTEM_INT_FIELDS: Final = {
+    "plug-cycles": "plug_cycles",
+    "error-counter": "error_counter",
+    "total-charging-sessions": "total_charging_sessions",
+    "led-brightness": "led_brightness",
+}
+# The Next's field key is misspelt; accept the corrected spelling as well.
+_FREE_CHARGING_TAG_FIELDS: Final = frozenset({"free-charging-alais", "free-charging-alias"})
+
 # API Configuration
 DEFAULT_TIMEOUT: Final = 30
+# Bound on opening a connection (TCP + TLS), so an unreachable wallbox fails
+# fast while slow responses keep the full request timeout.
+CONNECT_TIMEOUT: Final = 5
 TOKEN_REFRESH_MARGIN: Final = timedelta(minutes=5)
+# Assumed token lifetime when the JWT carries no readable ``exp`` claim.
+DEFAULT_TOKEN_LIFETIME: Final = timedelta(hours=1)
 MAX_RETRY_ATTEMPTS: Final = 3
 RETRY_BACKOFF_SECONDS: Final = 1.0
+# Retry delays double per attempt, are stretched by up to 50 % at random so
+# several clients don't retry a rebooting wallbox in lockstep, and are capped.
+RETRY_BACKOFF_JITTER: Final = 0.5
+RETRY_BACKOFF_MAX: Final = 30.0
+# Configuration updates issued within this window share one request.
+CONFIG_UPDATE_COALESCE_SECONDS: Final = 0.05
 
 
 class RestClientError(Exception):
@@ -93,6 +133,33 @@ class RestData:
     randomised_delay: int | None = None
 
 
+def _retry_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff after a failed attempt."""
+    delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+    jitter = 1 + random.random() * RETRY_BACKOFF_JITTER  # noqa: S311
+    return min(delay * jitter, RETRY_BACKOFF_MAX)
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    """Mark a shared future's exception as retrieved when nobody else awaited it."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _fetch_succeeded[T](result: T | BaseException, what: str) -> TypeGuard[T]:
+    """Return True if a gathered fetch succeeded, logging the failure otherwise.
+
+    Cancellation and other non-``Exception`` errors are re-raised rather than
+    swallowed like a failed endpoint.
+    """
+    if not isinstance(result, BaseException):
+        return True
+    if not isinstance(result, Exception):
+        raise result
+    _LOGGER.debug("Failed to fetch %s: %r", what, result)
+    return False
+
+
 class RestClient:
     """Async REST API client for Webasto Next / Ampure Unite wallboxes.
 
@@ -114,6 +181,7 @@ class RestClient:
         *,
         timeout: int = DEFAULT_TIMEOUT,
         model: str = MODEL_NEXT,
+        json_loads: Callable[[str], Any] = json.loads,
     ) -> None:
         """Initialize the REST client.
 
@@ -126,21 +194,41 @@ class RestClient:
                 wallbox uses a self-signed certificate, hence ``verify_ssl``
                 must be disabled by the caller. The session is owned by Home
                 Assistant and must not be closed here.
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds. Opening a connection is
+                bounded separately by ``CONNECT_TIMEOUT``.
             model: Wallbox model (``MODEL_NEXT`` or ``MODEL_UNITE``). The Unite
                 serves a different REST surface (flat configuration-fields
                 endpoint, different field keys and a single update type).
+            json_loads: JSON decoder for response bodies. Home Assistant
+                passes its orjson-backed ``json_loads``; defaults to the
+                stdlib decoder.
         """
         self._host = host
         self._username = username
         self._password = password
         self._base_url = f"https://{host}/api"
         self._model = model
+        self._json_loads = json_loads
 
         self._session = session
-        self._request_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._request_timeout = aiohttp.ClientTimeout(
+            total=timeout, sock_connect=min(timeout, CONNECT_TIMEOUT)
+        )
         self._token: str | None = None
-        self._token_expires: datetime | None = None
+        # Request headers for the current token, built once per login
+        self._auth_headers: dict[str, str] = {}
+        # Monotonic time after which the token is renewed before use.
+        self._token_refresh_at = 0.0
+        # Serialises logins so concurrent requests share one re-authentication.
+        self._login_lock = asyncio.Lock()
+        # Last ETag and decoded body per GET path, for conditional requests.
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        # Configuration updates collected for the request in its window, and
+        # the client-owned task that sends them once the window closes
+        self._pending_config_updates: list[dict[str, Any]] = []
+        self._config_flush: asyncio.Task[None] | None = None
+        # Flushes still sending, kept referenced until they finish
+        self._config_flushes_in_flight: set[asyncio.Task[None]] = set()
 
     @property
     def _is_unite(self) -> bool:
@@ -150,9 +238,7 @@ class RestClient:
     @property
     def is_connected(self) -> bool:
         """Return True if we have a valid token."""
-        if self._token is None or self._token_expires is None:
-            return False
-        return datetime.now(UTC) < self._token_expires - TOKEN_REFRESH_MARGIN
+        return self._token is not None and time.monotonic() < self._token_refresh_at
 
     async def connect(self) -> None:
         """Authenticate against the wallbox REST API.
@@ -164,13 +250,25 @@ class RestClient:
         await self._login()
 
     async def disconnect(self) -> None:
-        """Forget the auth token.
+        """Forget the auth token and stop pending configuration updates.
 
         The aiohttp session is owned by Home Assistant (shared), so it is
         intentionally not closed here.
         """
+        # Configuration requests still waiting or sending belong to the
+        # client; don't let them go out after it was disconnected.
+        flushes = tuple(self._config_flushes_in_flight)
+        for flush in flushes:
+            flush.cancel()
+        if flushes:
+            await asyncio.wait(flushes)
+        self._config_flush = None
+        self._pending_config_updates = []
         self._token = None
-        self._token_expires = None
+        self._token_refresh_at = 0.0
+        self._auth_headers = {}
+        # Bodies cached under the old session must not answer a 304 later.
+        self._etag_cache.clear()
 
     async def get_data(self) -> RestData:
         """Fetch all REST API data.
@@ -187,29 +285,27 @@ class RestClient:
         return await self._get_data_next()
 
     async def _get_data_next(self) -> RestData:
-        """Fetch REST data for the Webasto Next (per-section endpoints)."""
+        """Fetch REST data for the Webasto Next (per-section endpoints).
+
+        The three endpoints are independent, so they are requested concurrently
+        over the shared session's connection pool. A failing endpoint only
+        drops its own values.
+        """
         values: dict[str, Any] = {}
+        system_fields, auth_fields, errors = await asyncio.gather(
+            self._get_section("system"),
+            self._get_section("auth"),
+            self._get_current_errors(),
+            return_exceptions=True,
+        )
 
-        # Fetch system section
-        try:
-            system_fields = await self._get_section("system")
+        if _fetch_succeeded(system_fields, "system section"):
             self._parse_system_fields(system_fields, values)
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch system section: %r", err)
-
-        # Fetch auth section for free charging
-        try:
-            auth_fields = await self._get_section("auth")
+        # Auth section carries the free charging settings
+        if _fetch_succeeded(auth_fields, "auth section"):
             self._parse_auth_fields(auth_fields, values)
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch auth section: %r", err)
-
-        # Fetch current errors
-        try:
-            errors = await self._get_current_errors()
+        if _fetch_succeeded(errors, "current errors"):
             values["active_errors"] = errors
-        except Exception as err:
-            _LOGGER.debug("Failed to fetch current errors: %r", err)
 
         return RestData(**values)
 
@@ -394,8 +490,21 @@ class RestClient:
 
     async def _ensure_token(self) -> None:
         """Ensure we have a valid token, refresh if needed."""
-        if not self.is_connected:
-            await self._login()
+        if self.is_connected:
+            return
+        async with self._login_lock:
+            # Another request may have logged in while we waited for the lock.
+            if not self.is_connected:
+                await self._login()
+
+    async def _relogin(self, rejected_token: str | None) -> None:
+        """Re-authenticate after ``rejected_token`` got a 401.
+
+        Skipped if a concurrent request already replaced the rejected token.
+        """
+        async with self._login_lock:
+            if self._token == rejected_token or not self.is_connected:
+                await self._login()
 
     async def _login(self) -> None:
         """Authenticate and obtain JWT token."""
@@ -414,24 +523,61 @@ class RestClient:
                     msg = f"Login failed with status {resp.status}"
                     raise ConnectionError(msg)
 
-                data = await resp.json()
+                data = await resp.json(loads=self._json_loads)
                 self._token = data.get("access_token")
                 if not self._token:
                     msg = "No access_token in response"
                     raise AuthenticationError(msg)
+                self._auth_headers = {
+                    "Authorization": f"Bearer {self._token}",
+                    "Accept": "application/json",
+                }
 
-                # JWT tokens typically expire after some time
-                # We'll assume 1 hour if not specified
-                self._token_expires = datetime.now(UTC) + timedelta(hours=1)
+                lifetime = self._token_lifetime(self._token)
+                if lifetime is None:
+                    lifetime = DEFAULT_TOKEN_LIFETIME
+                # Short-lived tokens get a proportionally shorter margin so
+                # they are still used for half their life.
+                margin = min(TOKEN_REFRESH_MARGIN, lifetime / 2)
+                self._token_refresh_at = time.monotonic() + (lifetime - margin).total_seconds()
                 _LOGGER.debug("Successfully authenticated to REST API")
 
         except aiohttp.ClientError as err:
             msg = f"Connection to {self._host} failed: {err}"
             raise ConnectionError(msg) from err
 
+    def _token_lifetime(self, token: str) -> timedelta | None:
+        """Return a JWT's lifetime from its claims, or None if unknown.
+
+        The token is only decoded, not verified. The lifetime is taken as
+        ``exp - iat`` so a skewed wallbox clock does not shift the expiry; a
+        token that expires at or before it was issued gets a zero lifetime so
+        it is replaced on the next request. Without ``iat`` the expiry can
+        only be compared with the local clock, which may disagree with the
+        wallbox's, so a past ``exp`` there counts as unknown rather than
+        forcing a login on every request.
+        """
+        try:
+            payload = token.split(".")[1]
+            claims = self._json_loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode()
+            )
+            expires = datetime.fromtimestamp(int(claims["exp"]), UTC)
+            if "iat" not in claims:
+                lifetime = expires - datetime.now(UTC)
+                return lifetime if lifetime > timedelta(0) else None
+            issued = datetime.fromtimestamp(int(claims["iat"]), UTC)
+        except IndexError, KeyError, TypeError, ValueError, OverflowError, OSError:
+            return None
+        return max(expires - issued, timedelta(0))
+
     async def _get(self, path: str) -> Any:
-        """Make authenticated GET request."""
-        return await self._request("GET", path)
+        """Make authenticated GET request.
+
+        Sends ``If-None-Match`` once the wallbox has served an ETag for the
+        path and reuses the cached body on ``304 Not Modified``.
+        """
+        return await self._request("GET", path, conditional=True)
 
     async def _post(
         self,
@@ -455,20 +601,26 @@ class RestClient:
         path: str,
         *,
         json: Mapping[str, Any] | list[dict[str, Any]] | None = None,
+        conditional: bool = False,
     ) -> Any:
         """Make authenticated request with retry logic."""
         await self._ensure_token()
 
-        assert self._token is not None  # noqa: S101
+        token = self._token
+        if token is None:
+            # disconnect() ran while we were logging in
+            msg = "Not authenticated"
+            raise RestClientError(msg)
 
         url = f"{self._base_url}{path}"
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Accept": "application/json",
-        }
+        cached = self._etag_cache.get(path) if conditional else None
 
         last_error: Exception | None = None
         for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+            # Re-read each attempt: a 401 below replaces the login headers.
+            headers = self._auth_headers
+            if cached is not None:
+                headers = {**headers, "If-None-Match": cached[0]}
             try:
                 async with self._session.request(
                     method, url, headers=headers, json=json, timeout=self._request_timeout
@@ -476,9 +628,11 @@ class RestClient:
                     if resp.status == 401:
                         # Token expired, re-authenticate
                         _LOGGER.debug("Token expired (401), re-authenticating...")
-                        await self._login()
-                        headers["Authorization"] = f"Bearer {self._token}"
+                        await self._relogin(token)
+                        token = self._token
                         continue
+                    if resp.status == 304 and cached is not None:
+                        return cached[1]
                     if resp.status == 404:
                         msg = f"Endpoint not found: {path}"
                         raise RestClientError(msg)
@@ -487,8 +641,12 @@ class RestClient:
                         raise HttpRequestError(resp.status, path, text)
 
                     if resp.content_type == "application/json":
-                        return await resp.json()
-                    return await resp.text()
+                        body = await resp.json(loads=self._json_loads)
+                    else:
+                        body = await resp.text()
+                    if conditional and (etag := resp.headers.get("ETag")):
+                        self._etag_cache[path] = (etag, body)
+                    return body
 
             except asyncio.CancelledError:
                 raise
@@ -505,7 +663,7 @@ class RestClient:
                 if attempt == MAX_RETRY_ATTEMPTS:
                     break
 
-                await asyncio.sleep(RETRY_BACKOFF_SECONDS * attempt)
+                await asyncio.sleep(_retry_delay(attempt))
 
         msg = f"Request to {path} failed after {MAX_RETRY_ATTEMPTS} attempts"
         if last_error:
@@ -542,8 +700,32 @@ class RestClient:
         return result
 
     async def _update_config(self, updates: list[dict[str, Any]]) -> None:
-        """Update configuration fields."""
-        await self._post("/configuration-updates", json=updates)
+        """Update configuration fields.
+
+        Updates issued within ``CONFIG_UPDATE_COALESCE_SECONDS`` of each other
+        are posted as one request; every caller sees its outcome. The request
+        is sent by a task owned by the client, so a cancelled caller neither
+        cancels nor drops the others' updates.
+        """
+        self._pending_config_updates.extend(updates)
+        if (flush := self._config_flush) is None:
+            flush = asyncio.get_running_loop().create_task(
+                self._async_flush_config_updates(), name="webasto_rest_config_update"
+            )
+            flush.add_done_callback(_retrieve_exception)
+            flush.add_done_callback(self._config_flushes_in_flight.discard)
+            self._config_flushes_in_flight.add(flush)
+            self._config_flush = flush
+        # Shielded: a cancelled caller must not cancel the shared request.
+        await asyncio.shield(flush)
+
+    async def _async_flush_config_updates(self) -> None:
+        """Post the configuration updates collected during the window."""
+        await asyncio.sleep(CONFIG_UPDATE_COALESCE_SECONDS)
+        batch, self._pending_config_updates = self._pending_config_updates, []
+        # Later updates start a new request instead of joining this one.
+        self._config_flush = None
+        await self._post("/configuration-updates", json=batch)
 
     def _parse_unite_fields(self, fields: list[dict[str, Any]], values: dict[str, Any]) -> None:
         """Parse the Unite's flat configuration fields into values dict."""
@@ -585,26 +767,10 @@ class RestClient:
             key = field.get("fieldKey", "")
             value = field.get("value")
 
-            if key == "comboard-sw-version":
-                values["comboard_sw_version"] = value
-            elif key == "powerboard-sw-version":
-                values["powerboard_sw_version"] = value
-            elif key == "comboard-hw-version":
-                values["comboard_hw_version"] = value
-            elif key == "powerboard-hw-version":
-                values["powerboard_hw_version"] = value
-            elif key == "MAC-Address Eth0":
-                values["mac_address_ethernet"] = value
-            elif key == "MAC-Address WiFi":
-                values["mac_address_wifi"] = value
-            elif key == "plug-cycles":
-                values["plug_cycles"] = self._safe_int(value)
-            elif key == "error-counter":
-                values["error_counter"] = self._safe_int(value)
-            elif key == "total-charging-sessions":
-                values["total_charging_sessions"] = self._safe_int(value)
-            elif key == "led-brightness":
-                values["led_brightness"] = self._safe_int(value)
+            if (attr := _SYSTEM_TEXT_FIELDS.get(key)) is not None:
+                values[attr] = value
+            elif (attr := _SYSTEM_INT_FIELDS.get(key)) is not None:
+                values[attr] = self._safe_int(value)
             elif key == "interfaces":
                 values["ip_address"] = self._extract_ip(value)
             elif key == "signal-voltage":
@@ -622,7 +788,7 @@ class RestClient:
 
             if key == "free-charging":
                 values["free_charging_enabled"] = bool(value)
-            elif key in ("free-charging-alais", "free-charging-alias"):
+            elif key in _FREE_CHARGING_TAG_FIELDS:
                 values["free_charging_tag_id"] = value
 
     @staticmethod
@@ -643,10 +809,8 @@ class RestClient:
                 raw = value.get(key)
                 if raw is None:
                     continue
-                try:
-                    result[key] = float(str(raw).replace(",", "."))
-                except ValueError:
-                    continue
+                if (voltage := RestClient._to_float(str(raw))) is not None:
+                    result[key] = voltage
             return result or None
 
         if not isinstance(value, str):
@@ -656,19 +820,12 @@ class RestClient:
         if not text:
             return None
 
-        import re
-
-        parsed_values: dict[str, float] = {}
-        # Match patterns like "L1: 230.5", "L1:230,5V" or "L1 = 230.5 V"
-        pattern = r"L([123])\s*[:=]\s*([0-9]+(?:[\.,][0-9]+)?)"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-
-        for phase, voltage in matches:
-            try:
-                parsed_values[f"l{phase}"] = float(voltage.replace(",", "."))
-            except ValueError:
-                continue
-
+        # The pattern only matches digits with an optional "." or "," decimal,
+        # so every matched voltage parses.
+        parsed_values = {
+            f"l{phase}": float(voltage.replace(",", ".") if "," in voltage else voltage)
+            for phase, voltage in _SIGNAL_VOLTAGE_RE.findall(text)
+        }
         if parsed_values:
             return parsed_values
 
@@ -677,15 +834,24 @@ class RestClient:
         parts = [p.strip().replace("V", "").strip() for p in text.split(",")]
         if len(parts) == 3:
             try:
-                parsed_values["l1"] = float(parts[0].replace(",", "."))
-                parsed_values["l2"] = float(parts[1].replace(",", "."))
-                parsed_values["l3"] = float(parts[2].replace(",", "."))
-                return parsed_values
+                return {"l1": float(parts[0]), "l2": float(parts[1]), "l3": float(parts[2])}
             except ValueError:
                 pass
 
         return None
 
+    @staticmethod
+    def _to_float(text: str) -> float | None:
+        """Parse a decimal with either a "." or a "," separator."""
+        try:
+            return float(text)
+        except ValueError:
+            pass
+        try:
+            return float(text.replace(",", "."))
+        except ValueError:
+            return None
+
     @staticmethod
     def _safe_int(value: Any) -> int | None:
         """Safely convert value to int."""
@@ -703,12 +869,9 @@ class RestClient:
             return None
 
         # Look for IPv4 addresses (exclude 127.x.x.x and 172.20.x.x which is AP)
-        import re
-
-        pattern = r"inet\s+(\d+\.\d+\.\d+\.\d+)"
-        matches: list[str] = re.findall(pattern, interfaces_str)
+        matches: list[str] = _INET_RE.findall(interfaces_str)
 
         for ip in matches:
-            if not ip.startswith("127.") and not ip.startswith("172.20."):
+            if not ip.startswith(("127.", "172.20.")):
                 return ip
         return matches[0] if matches else None
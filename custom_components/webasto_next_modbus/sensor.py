@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Final
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
-from homeassistant.const import CONF_HOST, EntityCategory, UnitOfElectricPotential
+from homeassistant.const import CONF_HOST, UnitOfElectricPotential
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -14,10 +17,17 @@ from homeassistant.helpers.typing import StateType
 from . import WebastoConfigEntry
 from .const import CONF_UNIT_ID, RegisterDefinition, get_sensor_registers
 from .coordinator import WebastoDataCoordinator
-from .entity import WebastoRegisterEntity, WebastoRestEntity
+from .entity import WebastoRegisterEntity, WebastoRestEntity, get_entity_category
 from .hub import ModbusBridge
 from .rest_client import RestData
 
+# Registers holding a time of day encoded as hhmmss
+_TIME_OF_DAY_KEYS: Final[frozenset[str]] = frozenset({"session_start_time", "session_end_time"})
+
+# Sensor enums by their string value; unknown values are ignored
+_DEVICE_CLASSES: Final = MappingProxyType({member.value: member for member in SensorDeviceClass})
+_STATE_CLASSES: Final = MappingProxyType({member.value: member for member in SensorStateClass})
+
 
 @dataclass(frozen=True)
 class RestSensorDefinition:
@@ -51,29 +61,16 @@ REST_SENSORS: list[RestSensorDefinition] = [
         value_fn=lambda d: d.error_counter,
         state_class="total_increasing",
     ),
-    RestSensorDefinition(
-        key="signal_voltage_l1",
-        value_fn=lambda d: d.signal_voltage_l1,
-        device_class="voltage",
-        state_class="measurement",
-        unit=UnitOfElectricPotential.VOLT,
-        entity_category=None,
-    ),
-    RestSensorDefinition(
-        key="signal_voltage_l2",
-        value_fn=lambda d: d.signal_voltage_l2,
-        device_class="voltage",
-        state_class="measurement",
-        unit=UnitOfElectricPotential.VOLT,
-        entity_category=None,
-    ),
-    RestSensorDefinition(
-        key="signal_voltage_l3",
-        value_fn=lambda d: d.signal_voltage_l3,
-        device_class="voltage",
-        state_class="measurement",
-        unit=UnitOfElectricPotential.VOLT,
-        entity_category=None,
+    *(
+        RestSensorDefinition(
+            key=f"signal_voltage_l{phase}",
+            value_fn=attrgetter(f"signal_voltage_l{phase}"),
+            device_class="voltage",
+            state_class="measurement",
+            unit=UnitOfElectricPotential.VOLT,
+            entity_category=None,
+        )
+        for phase in (1, 2, 3)
     ),
     RestSensorDefinition(
         key="active_errors",
@@ -143,20 +140,18 @@ class WebastoSensor(WebastoRegisterEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator, bridge, host, unit_id, register, device_name)
 
-        if register.device_class:
-            try:
-                self._attr_device_class = SensorDeviceClass(register.device_class)
-            except ValueError:
-                pass
-        if register.state_class:
-            try:
-                self._attr_state_class = SensorStateClass(register.state_class)
-            except ValueError:
-                pass
+        if register.device_class in _DEVICE_CLASSES:
+            self._attr_device_class = _DEVICE_CLASSES[register.device_class]
+        if register.state_class in _STATE_CLASSES:
+            self._attr_state_class = _STATE_CLASSES[register.state_class]
         if register.unit:
             self._attr_native_unit_of_measurement = register.unit
 
-        self._options_map = register.options
+        self._is_time_of_day = register.key in _TIME_OF_DAY_KEYS
+        # Bound once; None for sensors without an options map
+        self._option_label: Callable[[int, str], str] | None = (
+            register.options.get if register.options else None
+        )
         if register.options:
             self._attr_options = list(register.options.values())
         if register.translation_key:
@@ -178,25 +173,31 @@ class WebastoSensor(WebastoRegisterEntity, SensorEntity):
             return
 
         # Handle time formatting for start/end time (hhmmss -> HH:MM:SS)
-        if self._register.key in ("session_start_time", "session_end_time"):
+        if self._is_time_of_day:
             try:
-                val_int = int(value)
-                # Pad with zeros to ensure 6 digits (e.g., 93000 -> 093000)
-                val_str = f"{val_int:06d}"
-                self._attr_native_value = f"{val_str[:2]}:{val_str[2:4]}:{val_str[4:]}"
-                return
+                hhmmss = int(value)
             except ValueError, TypeError:
                 # Fallback to raw value if formatting fails
                 pass
+            else:
+                self._attr_native_value = self._format_time_of_day(hhmmss)
+                return
 
-        if self._options_map:
+        if self._option_label is not None:
             try:
-                self._attr_native_value = self._options_map.get(int(value), str(value))
+                self._attr_native_value = self._option_label(int(value), str(value))
             except ValueError, TypeError:
                 self._attr_native_value = value
         else:
             self._attr_native_value = value
 
+    @staticmethod
+    def _format_time_of_day(hhmmss: int) -> str:
+        """Format an hhmmss integer (e.g. 93000) as HH:MM:SS."""
+        hours, rest = divmod(hhmmss, 10000)
+        minutes, seconds = divmod(rest, 100)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
 
 class WebastoRestSensor(WebastoRestEntity, SensorEntity):
     """Sensor entity for REST API data."""
@@ -213,24 +214,17 @@ class WebastoRestSensor(WebastoRestEntity, SensorEntity):
     ) -> None:
         super().__init__(coordinator, host, unit_id, definition.key, device_name)
         self._definition = definition
+        # RestData the native value was last derived from
+        self._source_data: RestData | None = None
 
-        if definition.device_class:
-            try:
-                self._attr_device_class = SensorDeviceClass(definition.device_class)
-            except ValueError:
-                pass
-        if definition.state_class:
-            try:
-                self._attr_state_class = SensorStateClass(definition.state_class)
-            except ValueError:
-                pass
+        if definition.device_class in _DEVICE_CLASSES:
+            self._attr_device_class = _DEVICE_CLASSES[definition.device_class]
+        if definition.state_class in _STATE_CLASSES:
+            self._attr_state_class = _STATE_CLASSES[definition.state_class]
         if definition.unit:
             self._attr_native_unit_of_measurement = definition.unit
-        if definition.entity_category:
-            try:
-                self._attr_entity_category = EntityCategory(definition.entity_category)
-            except ValueError:
-                pass
+        if (category := get_entity_category(definition.entity_category)) is not None:
+            self._attr_entity_category = category
         if definition.translation_key:
             self._attr_translation_key = definition.translation_key
 
@@ -244,6 +238,11 @@ class WebastoRestSensor(WebastoRestEntity, SensorEntity):
     def _update_value(self) -> None:
         """Update the native value from REST data."""
         rest_data = self.coordinator.rest_data
+        # RestData is frozen and replaced on every REST poll, so the same
+        # object means the Modbus-only update left this value unchanged.
+        if rest_data is self._source_data:
+            return
+        self._source_data = rest_data
         if rest_data is None:
             self._attr_native_value = None
             return
@@ -10,7 +10,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import WebastoConfigEntry
-from .const import CONF_UNIT_ID, DOMAIN, build_device_slug
+from .const import CONF_UNIT_ID, DOMAIN
 from .coordinator import WebastoDataCoordinator
 from .entity import WebastoRestEntity
 
@@ -35,7 +35,7 @@ async def async_setup_entry(
 
     # Add Free Charging Tag ID text entity if REST API is enabled
     if runtime.coordinator.rest_enabled:
-        _migrate_tag_id_unique_id(hass, host, unit_id)
+        _migrate_tag_id_unique_id(hass, runtime.device_slug, host, unit_id)
         entities.append(
             WebastoFreeChargingTagIdText(
                 runtime.coordinator,
@@ -48,10 +48,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def _migrate_tag_id_unique_id(hass: HomeAssistant, host: str, unit_id: int) -> None:
+def _migrate_tag_id_unique_id(
+    hass: HomeAssistant, device_slug: str, host: str, unit_id: int
+) -> None:
     """Migrate the pre-1.1.7 tag-id unique_id to the shared REST-entity scheme."""
 
-    new_uid = f"{build_device_slug(host, unit_id)}-rest-{_TAG_ID_KEY}"
+    new_uid = f"{device_slug}-rest-{_TAG_ID_KEY}"
     old_uid = f"{host}_{unit_id}_{_TAG_ID_KEY}"
     if old_uid == new_uid:
         return
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import ast
+import inspect
 import sys
+import textwrap
 import types
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import Any, cast
 
 import pytest
@@ -78,3 +81,37 @@ def default_virtual_wallbox() -> Generator[VirtualWallboxState]:
         scenario=build_default_scenario(),
     ) as state:
         yield state
+
+
+def _init_assigned_attributes(cls: type) -> set[str]:
+    """Return the ``self.<name>`` attributes assigned in ``cls.__init__``."""
+
+    tree = ast.parse(textwrap.dedent(inspect.getsource(cls.__init__)))
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        targets = (
+            node.targets
+            if isinstance(node, ast.Assign)
+            else [node.target]
+            if isinstance(node, ast.AnnAssign)
+            else []
+        )
+        for target in targets:
+            if (
+                isinstance(target, ast.Attribute)
+                and isinstance(target.value, ast.Name)
+                and target.value.id == "self"
+            ):
+                names.add(target.attr)
+    return names
+
+
+@pytest.fixture()
+def init_assigned_attributes() -> Callable[[type], set[str]]:
+    """Provide a helper listing the attributes a class' ``__init__`` assigns.
+
+    Lets slot tests check ``__slots__`` against ``__init__``: the HA base
+    classes keep a ``__dict__``, so a missing slot would not fail at runtime.
+    """
+
+    return _init_assigned_attributes
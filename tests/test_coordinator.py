@@ -60,6 +60,20 @@ def _build_coordinator(bridge: ModbusBridge, entry: MockConfigEntry) -> WebastoD
         )
 
 
+def _capture_background_tasks(entry: MockConfigEntry) -> list[asyncio.Task]:
+    """Run the entry's background tasks on the loop and collect them."""
+
+    tasks: list[asyncio.Task] = []
+
+    def _create(_hass, target, *_args, **_kwargs):
+        task = asyncio.ensure_future(target)
+        tasks.append(task)
+        return task
+
+    entry.async_create_background_task = _create  # type: ignore[method-assign]
+    return tasks
+
+
 async def test_coordinator_success_resets_failures() -> None:
     """Successful updates should reset failure counters and timestamps."""
 
@@ -68,15 +82,18 @@ async def test_coordinator_success_resets_failures() -> None:
     entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
 
     coordinator = _build_coordinator(bridge, entry)
+    coordinator._notification_active = True
 
     with patch(
         "custom_components.webasto_next_modbus.coordinator.persistent_notification.async_dismiss"
     ) as dismiss:
         data = await coordinator._async_update_data()
+        await coordinator._async_update_data()
 
     assert data == {"foo": 1}
     assert coordinator.consecutive_failures == 0
     assert coordinator.last_success is not None
+    # Only the first success has a notification to dismiss.
     dismiss.assert_called_once()
 
 
@@ -128,7 +145,7 @@ async def test_coordinator_emits_charging_started_trigger() -> None:
     entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
 
     coordinator = _build_coordinator(bridge, entry)
-    coordinator.data = {"charging_state": 0}
+    coordinator._last_charging_state = 0
 
     with patch(
         "custom_components.webasto_next_modbus.coordinator.async_fire_device_trigger"
@@ -155,7 +172,7 @@ async def test_coordinator_emits_charging_stopped_trigger() -> None:
     entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
 
     coordinator = _build_coordinator(bridge, entry)
-    coordinator.data = {"charging_state": 1}
+    coordinator._last_charging_state = 1
 
     with patch(
         "custom_components.webasto_next_modbus.coordinator.async_fire_device_trigger"
@@ -282,14 +299,29 @@ async def test_coordinator_retries_rest_setup_when_due() -> None:
     entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
 
     coordinator = _build_coordinator(bridge, entry)
-    coordinator.async_setup_rest_client = AsyncMock()
+    tasks = _capture_background_tasks(entry)
+    setup_started = asyncio.Event()
+    release_setup = asyncio.Event()
+
+    async def _slow_setup() -> None:
+        setup_started.set()
+        await release_setup.wait()
+
+    coordinator.async_setup_rest_client = AsyncMock(side_effect=_slow_setup)
     coordinator._rest_setup_retry_at = datetime.now(UTC) - timedelta(seconds=1)
 
     with patch(
         "custom_components.webasto_next_modbus.coordinator.persistent_notification.async_dismiss"
     ):
+        # The poll returns while the REST setup is still running.
+        await coordinator._async_update_data()
+        await setup_started.wait()
+        assert not tasks[0].done()
+        # A second poll doesn't start another attempt in the meantime.
         await coordinator._async_update_data()
 
+    release_setup.set()
+    await asyncio.gather(*tasks)
     coordinator.async_setup_rest_client.assert_awaited_once()
 
 
@@ -313,7 +345,7 @@ async def test_coordinator_does_not_retry_rest_setup_before_due() -> None:
 
 
 async def test_coordinator_force_refreshes_rest_data() -> None:
-    """`async_refresh_rest_data` bypasses the polling throttle and notifies listeners."""
+    """`async_refresh_rest_data` fetches immediately instead of waiting for the REST poll."""
 
     bridge = AsyncMock(spec=ModbusBridge)
     entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
@@ -323,8 +355,6 @@ async def test_coordinator_force_refreshes_rest_data() -> None:
     rest_client = MagicMock()
     rest_client.get_data = AsyncMock(return_value=sentinel)
     coordinator._rest_client = rest_client
-    # A regular poll would skip the fetch because the interval hasn't elapsed.
-    coordinator._rest_last_update = datetime.now(UTC)
 
     await coordinator.async_refresh_rest_data()
 
@@ -332,6 +362,40 @@ async def test_coordinator_force_refreshes_rest_data() -> None:
     assert coordinator.rest_data is sentinel
 
 
+async def test_coordinator_forced_refresh_waits_for_timer_fetch() -> None:
+    """A forced REST refresh lands after a timer fetch that was already running."""
+
+    bridge = AsyncMock(spec=ModbusBridge)
+    entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
+    coordinator = _build_coordinator(bridge, entry)
+    tasks = _capture_background_tasks(entry)
+
+    release_stale = asyncio.Event()
+    results = iter(["stale", "fresh"])
+
+    async def _get_data() -> str:
+        result = next(results)
+        if result == "stale":
+            await release_stale.wait()
+        return result
+
+    rest_client = MagicMock()
+    rest_client.get_data = AsyncMock(side_effect=_get_data)
+    coordinator._rest_client = rest_client
+
+    coordinator._async_rest_tick(datetime.now(UTC))
+    await asyncio.sleep(0)
+    refresh = asyncio.ensure_future(coordinator.async_refresh_rest_data())
+    await asyncio.sleep(0)
+    # The forced refresh doesn't fetch while the timer fetch is in flight.
+    assert rest_client.get_data.await_count == 1
+
+    release_stale.set()
+    await refresh
+    await asyncio.gather(*tasks)
+    assert coordinator.rest_data == "fresh"
+
+
 async def test_coordinator_rest_auth_failure_starts_reauth() -> None:
     """A 401 on the REST login starts a reauth flow and disables REST (no retry)."""
 
@@ -370,15 +434,90 @@ async def test_coordinator_rest_success_does_not_start_reauth() -> None:
         options={CONF_REST_ENABLED: True, CONF_REST_PASSWORD: "secret"},
     )
     coordinator = _build_coordinator(bridge, entry)
+    tasks = _capture_background_tasks(entry)
 
     with (
         patch.object(entry, "async_start_reauth") as start_reauth,
         patch("custom_components.webasto_next_modbus.coordinator.async_get_clientsession"),
         patch("custom_components.webasto_next_modbus.rest_client.RestClient") as mock_rc,
+        patch(
+            "custom_components.webasto_next_modbus.coordinator.async_track_time_interval"
+        ) as track_interval,
     ):
         mock_rc.return_value.connect = AsyncMock()
         mock_rc.return_value.disconnect = AsyncMock()
+        mock_rc.return_value.get_data = AsyncMock(return_value="rest")
         await coordinator.async_setup_rest_client()
+        await asyncio.gather(*tasks)
 
     assert coordinator._rest_client is mock_rc.return_value
+    assert coordinator.rest_data == "rest"
+    track_interval.assert_called_once()
     start_reauth.assert_not_called()
+
+    await coordinator.async_shutdown_rest_client()
+
+    track_interval.return_value.assert_called_once()
+    assert coordinator._rest_client is None
+
+
+async def test_coordinator_poll_does_not_fetch_rest_data() -> None:
+    """REST data is refreshed by its own timer, not by the Modbus poll."""
+
+    bridge = AsyncMock(spec=ModbusBridge)
+    bridge.async_read_data = AsyncMock(return_value={})
+    entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
+    coordinator = _build_coordinator(bridge, entry)
+
+    rest_client = MagicMock()
+    rest_client.get_data = AsyncMock()
+    coordinator._rest_client = rest_client
+
+    with patch(
+        "custom_components.webasto_next_modbus.coordinator.persistent_notification.async_dismiss"
+    ):
+        await coordinator._async_update_data()
+
+    rest_client.get_data.assert_not_awaited()
+
+
+async def test_coordinator_rest_tick_skips_while_fetch_in_flight() -> None:
+    """A REST poll tick doesn't start a second fetch while one is still running."""
+
+    bridge = AsyncMock(spec=ModbusBridge)
+    entry = MockConfigEntry(domain="webasto_next_modbus", entry_id="1234")
+    coordinator = _build_coordinator(bridge, entry)
+    tasks = _capture_background_tasks(entry)
+
+    release = asyncio.Event()
+
+    async def _slow_get_data() -> str:
+        await release.wait()
+        return "rest"
+
+    rest_client = MagicMock()
+    rest_client.get_data = AsyncMock(side_effect=_slow_get_data)
+    coordinator._rest_client = rest_client
+
+    coordinator._async_rest_tick(datetime.now(UTC))
+    await asyncio.sleep(0)
+    coordinator._async_rest_tick(datetime.now(UTC))
+    assert len(tasks) == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert coordinator.rest_data == "rest"
+    rest_client.get_data.assert_awaited_once()
+
+    # Once the fetch finished, the next tick fetches again.
+    coordinator._async_rest_tick(datetime.now(UTC))
+    await asyncio.gather(*tasks)
+    assert rest_client.get_data.await_count == 2
+
+
+async def test_coordinator_slots_cover_init_attributes(init_assigned_attributes) -> None:
+    """Every attribute __init__ sets has a slot, and the slots stay sorted."""
+
+    slots = WebastoDataCoordinator.__slots__
+    assert list(slots) == sorted(slots)
+    assert init_assigned_attributes(WebastoDataCoordinator) <= set(slots)
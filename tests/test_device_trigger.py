@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from types import SimpleNamespace
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.components.device_automation.exceptions import InvalidDeviceAutomationConfig
 from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
 from homeassistant.helpers.trigger import TriggerInfo
 
 from custom_components.webasto_next_modbus import device_trigger
 from custom_components.webasto_next_modbus.const import DOMAIN
 from custom_components.webasto_next_modbus.device_trigger import (
-    SIGNAL_DEVICE_TRIGGER,
     TRIGGER_CHARGING_STARTED,
+    TRIGGER_CHARGING_STOPPED,
     async_fire_device_trigger,
 )
 
@@ -27,6 +29,7 @@ def _make_hass() -> MagicMock:
     hass = MagicMock()
     hass.loop = loop
     hass.async_create_task = loop.create_task
+    hass.async_run_hass_job = MagicMock()
     hass.data = {}
     return hass
 
@@ -53,37 +56,17 @@ async def test_async_get_triggers_returns_supported_types() -> None:
         assert trigger[CONF_DEVICE_ID] == "device-id"
 
 
-async def test_async_attach_trigger_invokes_action_on_dispatch() -> None:
-    """Attaching a trigger should subscribe to dispatcher and execute the action."""
-
-    hass = _make_hass()
+async def _attach(hass: MagicMock, action: AsyncMock) -> Callable[[], None]:
     device_entry = SimpleNamespace(identifiers={(DOMAIN, "mock-device")})
     registry = MagicMock()
     registry.async_get.return_value = device_entry
-
-    captured_signal: str | None = None
-    dispatcher_callback = None
-
-    def _fake_connect(_hass, signal, callback):
-        nonlocal captured_signal, dispatcher_callback
-        captured_signal = signal
-        dispatcher_callback = callback
-        return lambda: None
-
-    action = AsyncMock()
     trigger_info = cast(TriggerInfo, SimpleNamespace(context=None))
 
-    with (
-        patch(
-            "custom_components.webasto_next_modbus.device_trigger.dr.async_get",
-            return_value=registry,
-        ),
-        patch(
-            "custom_components.webasto_next_modbus.device_trigger.async_dispatcher_connect",
-            side_effect=_fake_connect,
-        ),
+    with patch(
+        "custom_components.webasto_next_modbus.device_trigger.dr.async_get",
+        return_value=registry,
     ):
-        await device_trigger.async_attach_trigger(
+        return await device_trigger.async_attach_trigger(
             hass,
             {
                 CONF_PLATFORM: "device",
@@ -95,36 +78,103 @@ async def test_async_attach_trigger_invokes_action_on_dispatch() -> None:
             trigger_info,
         )
 
-    assert captured_signal == SIGNAL_DEVICE_TRIGGER.format(device_slug="mock-device")
-    assert dispatcher_callback is not None
 
-    dispatcher_callback(TRIGGER_CHARGING_STARTED, {"foo": "bar"})
-    await asyncio.sleep(0)
+async def test_async_attach_trigger_invokes_action_on_fire() -> None:
+    """Firing an attached trigger should run the action job with the payload."""
+
+    hass = _make_hass()
+    action = AsyncMock()
+    await _attach(hass, action)
 
-    action.assert_awaited_once()
-    await_args = action.await_args
-    assert await_args is not None
-    payload, context = await_args.args
+    async_fire_device_trigger(hass, "mock-device", TRIGGER_CHARGING_STARTED, {"foo": "bar"})
+
+    hass.async_run_hass_job.assert_called_once()
+    job, payload, context = hass.async_run_hass_job.call_args.args
+    assert job.target is action
     assert payload[CONF_TYPE] == TRIGGER_CHARGING_STARTED
+    assert payload[CONF_DEVICE_ID] == "device-id"
     assert payload["foo"] == "bar"
     assert context is None
 
 
-async def test_async_fire_device_trigger_emits_dispatch() -> None:
-    """async_fire_device_trigger should send dispatcher events."""
+async def test_async_fire_device_trigger_ignores_other_types_and_devices() -> None:
+    """Only triggers attached for the fired device and type run."""
+
+    hass = _make_hass()
+    await _attach(hass, AsyncMock())
+
+    async_fire_device_trigger(hass, "mock-device", TRIGGER_CHARGING_STOPPED)
+    async_fire_device_trigger(hass, "other-device", TRIGGER_CHARGING_STARTED)
+
+    hass.async_run_hass_job.assert_not_called()
+
+
+async def test_detached_trigger_no_longer_fires() -> None:
+    """Detaching removes the job and cleans up the empty buckets."""
+
+    hass = _make_hass()
+    detach = await _attach(hass, AsyncMock())
+
+    detach()
+    async_fire_device_trigger(hass, "mock-device", TRIGGER_CHARGING_STARTED)
+
+    hass.async_run_hass_job.assert_not_called()
+    assert hass.data[device_trigger._DATA_TRIGGER_JOBS] == {}
+
+
+async def test_device_slug_lookup_is_cached_until_registry_update() -> None:
+    """Repeated lookups hit the cache; a registry update invalidates the entry."""
 
     hass = _make_hass()
-    dispatcher = MagicMock()
+    device_entry = SimpleNamespace(identifiers={(DOMAIN, "mock-device")})
+    registry = MagicMock()
+    registry.async_get.return_value = device_entry
 
     with patch(
-        "custom_components.webasto_next_modbus.device_trigger.async_dispatcher_send",
-        dispatcher,
+        "custom_components.webasto_next_modbus.device_trigger.dr.async_get",
+        return_value=registry,
     ):
-        async_fire_device_trigger(hass, "mock-device", TRIGGER_CHARGING_STARTED, {"foo": "bar"})
-
-    dispatcher.assert_called_once_with(
-        hass,
-        SIGNAL_DEVICE_TRIGGER.format(device_slug="mock-device"),
-        TRIGGER_CHARGING_STARTED,
-        {"foo": "bar"},
-    )
+        await device_trigger.async_get_triggers(hass, "device-id")
+        await device_trigger.async_get_triggers(hass, "device-id")
+        assert registry.async_get.call_count == 1
+
+        listener = hass.bus.async_listen.call_args.args[1]
+        listener(SimpleNamespace(data={"action": "update", "device_id": "device-id"}))
+
+        await device_trigger.async_get_triggers(hass, "device-id")
+        assert registry.async_get.call_count == 2
+
+
+async def test_device_slug_cache_release_stops_registry_listener() -> None:
+    """Releasing the cache unsubscribes its registry listener."""
+
+    hass = _make_hass()
+    registry = MagicMock()
+    registry.async_get.return_value = SimpleNamespace(identifiers={(DOMAIN, "mock-device")})
+
+    with patch(
+        "custom_components.webasto_next_modbus.device_trigger.dr.async_get",
+        return_value=registry,
+    ):
+        await device_trigger.async_get_triggers(hass, "device-id")
+
+    unsub = hass.bus.async_listen.return_value
+    device_trigger.async_release_device_slug_cache(hass)
+
+    unsub.assert_called_once()
+    assert device_trigger._DATA_SLUG_CACHE not in hass.data
+    # Releasing again (e.g. no trigger was ever looked up) is a no-op.
+    device_trigger.async_release_device_slug_cache(hass)
+    unsub.assert_called_once()
+
+
+async def test_async_attach_trigger_rejects_unknown_type() -> None:
+    """Attaching an unknown trigger type fails without touching the registry."""
+
+    with pytest.raises(InvalidDeviceAutomationConfig):
+        await device_trigger.async_attach_trigger(
+            _make_hass(),
+            {CONF_PLATFORM: "device", CONF_DEVICE_ID: "device-id", CONF_TYPE: "bogus"},
+            AsyncMock(),
+            cast(TriggerInfo, SimpleNamespace(context=None)),
+        )
@@ -7,6 +7,7 @@ from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.const import EntityCategory
 
 from custom_components.webasto_next_modbus.binary_sensor import WebastoChargingSensor
 from custom_components.webasto_next_modbus.button import WebastoButton
@@ -14,11 +15,14 @@ from custom_components.webasto_next_modbus.const import (
     KEEPALIVE_TRIGGER_VALUE,
     SESSION_COMMAND_START_VALUE,
     SESSION_COMMAND_STOP_VALUE,
-    SIGNAL_REGISTER_WRITTEN,
+    build_register_written_signal,
     get_register,
 )
 from custom_components.webasto_next_modbus.device_trigger import TRIGGER_KEEPALIVE_SENT
-from custom_components.webasto_next_modbus.entity import WebastoRegisterEntity
+from custom_components.webasto_next_modbus.entity import (
+    WebastoRegisterEntity,
+    get_entity_category,
+)
 from custom_components.webasto_next_modbus.hub import WebastoModbusError
 from custom_components.webasto_next_modbus.number import WebastoNumber
 from custom_components.webasto_next_modbus.sensor import WebastoSensor
@@ -47,7 +51,10 @@ def coordinator_fixture():
     class DummyCoordinator:
         def __init__(self) -> None:
             self.data: dict[str, object] = {}
+            self.last_update_success = True
             self.rest_data = None
+            self.rest_revision = 0
+            self.device_slug = "192.0.2.1-255"
             self.async_request_refresh = AsyncMock()
             self.hass = MagicMock()
             self.config_entry = DummyConfigEntry()
@@ -63,8 +70,12 @@ def coordinator_fixture():
 async def _drain_background_tasks(coordinator) -> None:
     """Run any background tasks the entity scheduled to completion."""
 
-    for task in list(coordinator.config_entry.background_tasks):
-        await task
+    # Tasks may schedule further tasks (e.g. a re-applied write refreshing the
+    # coordinator), so keep going until nothing is pending.
+    while pending := [
+        task for task in coordinator.config_entry.background_tasks if not task.done()
+    ]:
+        await asyncio.gather(*pending)
 
 
 async def test_sensor_maps_enum_value(coordinator_fixture) -> None:
@@ -76,17 +87,32 @@ async def test_sensor_maps_enum_value(coordinator_fixture) -> None:
 
     sensor = WebastoSensor(coordinator, bridge, "192.0.2.10", 7, register, DEVICE_NAME)
 
-    assert sensor.unique_id == "192.0.2.10-7-charge_point_state"
+    assert sensor.unique_id == "192.0.2.1-255-charge_point_state"
     assert sensor.native_value == "charging"
 
 
+async def test_sensor_formats_session_time_of_day(coordinator_fixture) -> None:
+    """Session start/end times are shown as HH:MM:SS, raw values otherwise."""
+
+    coordinator, bridge = coordinator_fixture
+    register = get_register("session_start_time")
+    coordinator.data = {register.key: 93005}
+
+    sensor = WebastoSensor(coordinator, bridge, "192.0.2.10", 7, register, DEVICE_NAME)
+    assert sensor.native_value == "09:30:05"
+
+    coordinator.data = {register.key: "n/a"}
+    sensor._update_value()
+    assert sensor.native_value == "n/a"
+
+
 async def test_charging_binary_sensor_reflects_state(coordinator_fixture) -> None:
     """The charging binary sensor is on only while charging_state == 1."""
 
     coordinator, _bridge = coordinator_fixture
-    sensor = WebastoChargingSensor(coordinator, "192.0.2.10", 7, DEVICE_NAME)
+    sensor = WebastoChargingSensor(coordinator, DEVICE_NAME)
 
-    assert sensor.unique_id == "192.0.2.10-7-charging"
+    assert sensor.unique_id == "192.0.2.1-255-charging"
     assert sensor.translation_key == "charging"
 
     coordinator.data = {"charging_state": 1}
@@ -134,12 +160,43 @@ async def test_number_clamps_and_writes(coordinator_fixture) -> None:
     )
 
     await number.async_set_native_value(99)
+    await _drain_background_tasks(coordinator)
 
     bridge.async_write_register.assert_awaited_with(register, register.max_value)
     coordinator.async_request_refresh.assert_awaited()
     assert number.native_value == register.max_value
 
 
+async def test_number_refreshes_without_config_entry(coordinator_fixture) -> None:
+    """The post-write refresh is still scheduled when there is no config entry."""
+
+    coordinator, bridge = coordinator_fixture
+    coordinator.config_entry = None
+    register = get_register("failsafe_current_a")
+    coordinator.data = {register.key: 12}
+
+    number = WebastoNumber(
+        coordinator,
+        bridge,
+        "192.0.2.11",
+        9,
+        register,
+        DEVICE_NAME,
+        32,
+    )
+    tasks: list[asyncio.Future] = []
+    number.hass = MagicMock()
+    number.hass.async_create_background_task = MagicMock(
+        side_effect=lambda target, **_kwargs: tasks.append(asyncio.ensure_future(target))
+    )
+
+    await number.async_set_native_value(10)
+    await asyncio.gather(*tasks)
+
+    number.hass.async_create_background_task.assert_called_once()
+    coordinator.async_request_refresh.assert_awaited_once()
+
+
 async def test_number_respects_variant_limit(coordinator_fixture) -> None:
     """Number entities should clamp to the variant-specific maximum."""
 
@@ -158,6 +215,7 @@ async def test_number_respects_variant_limit(coordinator_fixture) -> None:
     )
 
     await number.async_set_native_value(99)
+    await _drain_background_tasks(coordinator)
 
     bridge.async_write_register.assert_awaited_with(register, 16)
     coordinator.async_request_refresh.assert_awaited()
@@ -206,6 +264,7 @@ async def test_write_only_number_persists_last_value(coordinator_fixture) -> Non
     )
 
     await number.async_set_native_value(18)
+    await _drain_background_tasks(coordinator)
 
     bridge.async_write_register.assert_awaited_with(register, 18)
     coordinator.async_request_refresh.assert_awaited()
@@ -296,6 +355,49 @@ async def test_button_stop_session(coordinator_fixture) -> None:
     coordinator.async_request_refresh.assert_awaited()
 
 
+async def test_number_skips_state_write_for_unchanged_value(coordinator_fixture) -> None:
+    """Coordinator ticks that change nothing for a number don't write its state."""
+
+    coordinator, bridge = coordinator_fixture
+    register = get_register("failsafe_current_a")
+    coordinator.data = {register.key: 16}
+
+    number = WebastoNumber(coordinator, bridge, "192.0.2.16", 11, register, DEVICE_NAME, 32)
+    number.hass = MagicMock()
+    number.async_write_ha_state = MagicMock()
+
+    number._handle_coordinator_update()
+    number._handle_coordinator_update()
+    assert number.async_write_ha_state.call_count == 1
+
+    coordinator.last_update_success = False
+    number._handle_coordinator_update()
+    assert number.async_write_ha_state.call_count == 2
+
+    coordinator.last_update_success = True
+    coordinator.data = {register.key: 12}
+    number._handle_coordinator_update()
+    assert number.async_write_ha_state.call_count == 3
+    assert number.native_value == 12
+
+
+async def test_unset_write_only_number_skips_state_writes(coordinator_fixture) -> None:
+    """A write-only number without a known value stays quiet across polls."""
+
+    coordinator, bridge = coordinator_fixture
+    register = get_register("set_current_a")
+
+    number = WebastoNumber(coordinator, bridge, "192.0.2.17", 11, register, DEVICE_NAME, 32)
+    number.hass = MagicMock()
+    number.async_write_ha_state = MagicMock()
+
+    for _ in range(3):
+        number._handle_coordinator_update()
+
+    assert number.native_value is None
+    assert number.async_write_ha_state.call_count == 1
+
+
 async def test_write_only_number_updates_from_dispatcher(coordinator_fixture) -> None:
     """Numbers should update state when services emit dispatcher signals."""
 
@@ -314,11 +416,12 @@ async def test_write_only_number_updates_from_dispatcher(coordinator_fixture) ->
     number.async_write_ha_state = MagicMock()
     number.async_get_last_number_data = AsyncMock(return_value=None)
 
-    captured: list[Callable[[str, str, object | None], None]] = []
+    captured: list[Callable[[object | None], None]] = []
 
     def _connect(hass, signal, callback):
         assert hass is number.hass
-        assert signal == SIGNAL_REGISTER_WRITTEN
+        # Only writes to this device's set_current_a register reach the entity.
+        assert signal == build_register_written_signal("192.0.2.15-11", "set_current_a")
         captured.append(callback)
         return lambda: None
 
@@ -330,16 +433,13 @@ async def test_write_only_number_updates_from_dispatcher(coordinator_fixture) ->
 
     assert captured
     callback = captured[0]
-    callback("192.0.2.15-11", "set_current_a", 24)
+    callback(24)
 
     assert number.native_value == 24
     assert number._last_written_value == 24
     number.async_write_ha_state.assert_called()
 
-    callback("other-slug", "set_current_a", 30)
-    assert number.native_value == 24
-
-    callback("192.0.2.15-11", "set_current_a", None)
+    callback(None)
     assert number.native_value is None
     assert number._last_written_value is None
 
@@ -422,11 +522,17 @@ async def test_write_only_number_restores_last_value(coordinator_fixture) -> Non
         return_value=lambda: None,
     ):
         await number.async_added_to_hass()
+        # Setup shows the restored value at once; the Modbus re-apply runs in
+        # the background instead of holding up the platform.
+        assert number.native_value == 18
+        bridge.async_write_register.assert_not_awaited()
         await _drain_background_tasks(coordinator)
 
     bridge.async_write_register.assert_awaited_with(register, 18)
-    coordinator.async_request_refresh.assert_awaited()
-    number.async_write_ha_state.assert_called()
+    # Re-applying only pushes the value to the wallbox; the entity already
+    # shows it and the next regular poll follows anyway.
+    coordinator.async_request_refresh.assert_not_awaited()
+    number.async_write_ha_state.assert_not_called()
     assert number.native_value == 18
     assert number._last_written_value == 18
 
@@ -465,9 +571,9 @@ async def test_connectivity_binary_sensor(coordinator_fixture) -> None:
     coordinator, _bridge = coordinator_fixture
     coordinator.last_update_success = True
 
-    sensor = WebastoConnectivitySensor(coordinator, "192.0.2.40", 3, DEVICE_NAME)
+    sensor = WebastoConnectivitySensor(coordinator, DEVICE_NAME)
 
-    assert sensor.unique_id == "192.0.2.40-3-connected"
+    assert sensor.unique_id == "192.0.2.1-255-connected"
     assert sensor.translation_key == "connected"
     assert sensor.available is True
     assert sensor.is_on is True
@@ -477,6 +583,65 @@ async def test_connectivity_binary_sensor(coordinator_fixture) -> None:
     assert sensor.is_on is False
 
 
+async def test_rest_entity_availability_follows_coordinator_updates(coordinator_fixture) -> None:
+    """REST entities become available once the coordinator reports REST data."""
+
+    from custom_components.webasto_next_modbus.sensor import REST_SENSORS, WebastoRestSensor
+
+    coordinator, _bridge = coordinator_fixture
+    coordinator.rest_enabled = True
+
+    sensor = WebastoRestSensor(coordinator, "192.0.2.52", 3, REST_SENSORS[0], DEVICE_NAME)
+    sensor.hass = MagicMock()
+    sensor.async_write_ha_state = MagicMock()
+    assert sensor.available is False
+
+    coordinator.rest_data = MagicMock(
+        comboard_sw_version=None,
+        comboard_hw_version=None,
+        ip_address=None,
+        mac_address_ethernet=None,
+        mac_address_wifi=None,
+    )
+    coordinator.rest_revision += 1
+    sensor._handle_coordinator_update()
+    assert sensor.available is True
+
+    coordinator.rest_enabled = False
+    sensor._handle_coordinator_update()
+    assert sensor.available is False
+
+
+async def test_rest_sensor_reuses_value_until_rest_data_changes(coordinator_fixture) -> None:
+    """Modbus-only updates do not re-derive a REST sensor's value."""
+
+    from custom_components.webasto_next_modbus.rest_client import RestData
+    from custom_components.webasto_next_modbus.sensor import (
+        RestSensorDefinition,
+        WebastoRestSensor,
+    )
+
+    coordinator, _bridge = coordinator_fixture
+    coordinator.rest_enabled = True
+    value_fn = MagicMock(side_effect=lambda d: d.active_errors)
+    definition = RestSensorDefinition(key="active_errors", value_fn=value_fn)
+
+    sensor = WebastoRestSensor(coordinator, "192.0.2.52", 3, definition, DEVICE_NAME)
+    sensor.hass = MagicMock()
+    sensor.async_write_ha_state = MagicMock()
+
+    coordinator.rest_data = RestData(active_errors=["E1", "E2"])
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == "E1, E2"
+    assert value_fn.call_count == 1
+
+    coordinator.rest_data = RestData(active_errors=[])
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == "ok"
+    assert value_fn.call_count == 2
+
+
 async def test_led_brightness_does_not_revert_to_stale_value(coordinator_fixture) -> None:
     """Setting LED brightness forces a REST refresh and isn't bounced back by stale cache."""
 
@@ -618,3 +783,25 @@ async def test_unite_number_of_phases_tracks_phase_switch_register() -> None:
     register = next(r for r in get_sensor_registers(MODEL_UNITE) if r.key == "number_of_phases")
     assert register.address == 405
     assert register.register_type == "holding"
+
+
+async def test_get_entity_category_maps_known_values() -> None:
+    """Definition strings map to EntityCategory; unknown or missing ones don't."""
+
+    assert get_entity_category("diagnostic") is EntityCategory.DIAGNOSTIC
+    assert get_entity_category("config") is EntityCategory.CONFIG
+    assert get_entity_category("bogus") is None
+    assert get_entity_category(None) is None
+
+
+async def test_number_slots_cover_init_attributes(init_assigned_attributes) -> None:
+    """WebastoNumber slots its own state; ``_attr_*`` stay HA class defaults."""
+
+    slots = WebastoNumber.__slots__
+    assert list(slots) == sorted(slots)
+    own = {
+        name
+        for name in init_assigned_attributes(WebastoNumber)
+        if not name.startswith("_attr_")
+    }
+    assert own <= set(slots)
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import socket
+from dataclasses import replace
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+from custom_components.webasto_next_modbus.const import (
+    MODEL_NEXT,
+    MODEL_UNITE,
+    get_number_registers,
+    get_readable_registers,
+    get_register,
+)
 from custom_components.webasto_next_modbus.hub import (
     WebastoModbusDeviceError,
     WebastoModbusError,
+    _build_read_plan,
+    _configure_socket,
+    _decode_block,
+    _decode_register,
     _describe_modbus_response,
+    _read_plans_for,
 )
 
 
@@ -32,3 +47,123 @@ def test_describe_modbus_response_with_unknown_code() -> None:
 def test_describe_modbus_response_falls_back_to_str() -> None:
     # No exception_code attribute -> uses str() of the response.
     assert "boom" in _describe_modbus_response(SimpleNamespace(detail="boom"))
+
+
+def test_read_plan_deduplicates_shared_registers() -> None:
+    """Definitions decoding the same registers are read and decoded once."""
+
+    register = get_register("failsafe_current_a")
+    alias = replace(register, key="failsafe_current_alias")
+
+    plan = _build_read_plan((register, alias))
+
+    assert len(plan) == 1
+    assert len(plan[0].fields) == 1
+    assert plan[0].fields[0].keys == ("failsafe_current_a", "failsafe_current_alias")
+
+
+def test_read_plan_bridges_small_gaps() -> None:
+    """Nearby registers share a block; optional registers keep their own."""
+
+    required = [get_register("charge_point_state"), get_register("charging_state")]
+    optional = get_register("smart_vehicle_detected")
+    distant = get_register("failsafe_current_a")
+
+    plan = _build_read_plan((*required, optional, distant))
+
+    assert [(request.start_address, request.count) for request in plan] == [
+        (1000, 2),
+        (1620, 2),
+        (2000, 1),
+    ]
+
+
+def test_read_plan_precomputes_field_offsets() -> None:
+    """Each field knows where its registers sit inside the block response."""
+
+    first = get_register("charge_point_state")
+    second = get_register("charging_state")
+
+    (request,) = _build_read_plan((first, second))
+
+    offsets = {field.keys[0]: field.offset for field in request.fields}
+    assert offsets[first.key] == 0
+    assert offsets[second.key] == second.address - request.start_address
+
+
+def test_number_registers_are_polled_in_the_bulk_read() -> None:
+    """Number entities read their value from the coalesced blocks, not per register."""
+
+    for model in (MODEL_NEXT, MODEL_UNITE):
+        polled = {
+            key
+            for request in _build_read_plan(get_readable_registers(model))
+            for field in request.fields
+            for key in field.keys
+        }
+        numbers = [register for register in get_number_registers(model) if not register.write_only]
+        assert {register.key for register in numbers} <= polled
+
+
+def test_read_plans_are_built_once_per_register_table() -> None:
+    """Bridges polling the same static table share one precomputed plan."""
+
+    registers = get_readable_registers()
+    holding_plan, input_plan = _read_plans_for(registers)
+
+    assert _read_plans_for(registers)[0] is holding_plan
+    assert all(request.register_type == "holding" for request in holding_plan)
+    assert all(request.register_type == "input" for request in input_plan)
+    assert (*holding_plan, *input_plan) == _build_read_plan(registers)
+
+
+def test_decode_register_shares_decoders_per_layout() -> None:
+    """Definitions with the same layout decode through one shared decoder."""
+
+    register = get_register("failsafe_current_a")
+    uint32 = replace(register, data_type="uint32", count=2)
+    scaled = replace(uint32, key="scaled", scale=0.001)
+    text = replace(register, data_type="string", count=2, encoding="ascii")
+
+    assert _decode_register(register, [16]) == 16
+    assert _decode_register(uint32, [1, 2]) == 65538
+    assert _decode_register(scaled, [0, 1500]) == 1.5
+    assert _decode_register(text, [0x4142, 0x4300]) == "ABC"
+
+    (request,) = _build_read_plan((uint32, replace(uint32, key="other", address=2004)))
+    assert request.fields[0].decode is request.fields[1].decode
+
+
+def test_block_layout_matches_per_field_decoding() -> None:
+    """One struct unpack per block yields what the per-field decoders yield."""
+
+    for request in _build_read_plan(get_readable_registers()):
+        assert request.layout is not None
+        registers = [(0x4100 + index) & 0xFFFF for index in range(request.count)]
+        payload = b"".join(value.to_bytes(2, "big") for value in registers)
+        expected = {
+            key: field.decode(payload, field.offset)
+            for field in request.fields
+            for key in field.keys
+        }
+
+        data: dict[str, float | int | str | None] = {}
+        _decode_block(request, registers, data)
+
+        assert data == expected
+
+
+def test_configure_socket_sets_nodelay_and_keepalive() -> None:
+    """The client's TCP socket is found through the pymodbus ctx transport."""
+
+    sock = MagicMock()
+    transport = SimpleNamespace(get_extra_info=lambda name: sock if name == "socket" else None)
+    client = SimpleNamespace(ctx=SimpleNamespace(transport=transport))
+
+    _configure_socket(client)
+
+    sock.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    # Clients without a transport (e.g. the simulator) are left alone.
+    _configure_socket(SimpleNamespace())
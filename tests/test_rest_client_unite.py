@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import time
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from custom_components.webasto_next_modbus.const import MODEL_NEXT, MODEL_UNITE
-from custom_components.webasto_next_modbus.rest_client import RestClient, RestClientError
+from custom_components.webasto_next_modbus.rest_client import (
+    DEFAULT_TOKEN_LIFETIME,
+    RETRY_BACKOFF_JITTER,
+    RETRY_BACKOFF_MAX,
+    RETRY_BACKOFF_SECONDS,
+    TOKEN_REFRESH_MARGIN,
+    RestClient,
+    RestClientError,
+    _retry_delay,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -221,3 +235,258 @@ async def test_next_get_data_uses_sections() -> None:
 
     # Next reads the per-section endpoints, not the Unite's flat one.
     assert client._get_section.await_count == 2
+
+
+async def test_next_get_data_keeps_sections_that_succeeded() -> None:
+    client = _next_client()
+
+    async def _section(section: str) -> list[dict[str, object]]:
+        if section == "auth":
+            raise RestClientError("boom")
+        return [{"fieldKey": "plug-cycles", "value": "42"}]
+
+    client._get_section = _section  # type: ignore[method-assign]
+    client._get_current_errors = AsyncMock(return_value=["E1"])  # type: ignore[method-assign]
+
+    data = await client.get_data()
+
+    # A failing endpoint only drops its own values.
+    assert data.plug_cycles == 42
+    assert data.free_charging_enabled is None
+    assert data.active_errors == ["E1"]
+
+
+async def test_retry_delay_grows_exponentially_with_bounded_jitter() -> None:
+    for attempt in (1, 2, 3):
+        base = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+        delay = _retry_delay(attempt)
+        assert base <= delay <= base * (1 + RETRY_BACKOFF_JITTER)
+
+    assert _retry_delay(20) == RETRY_BACKOFF_MAX
+
+
+def _jwt(claims: dict[str, object]) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+async def test_token_lifetime_is_read_from_jwt_claims() -> None:
+    client = _next_client()
+
+    # exp - iat, independent of the wallbox clock
+    assert client._token_lifetime(_jwt({"iat": 1000, "exp": 8200})) == timedelta(hours=2)
+    # Short-lived tokens keep their lifetime; unreadable ones fall back
+    assert client._token_lifetime(_jwt({"iat": 1000, "exp": 1060})) == timedelta(minutes=1)
+    assert client._token_lifetime("opaque-token") is None
+    assert client._token_lifetime(_jwt({"sub": "admin"})) is None
+    # Expired tokens are not trusted at all
+    assert client._token_lifetime(_jwt({"iat": 1000, "exp": 1000})) == timedelta(0)
+    assert client._token_lifetime(_jwt({"iat": 1000, "exp": 900})) == timedelta(0)
+    # Without iat only the local clock is left to compare with
+    expires = int(time.time()) + 600
+    lifetime = client._token_lifetime(_jwt({"exp": expires}))
+    assert lifetime is not None
+    assert timedelta(minutes=9) < lifetime <= timedelta(minutes=10)
+    assert DEFAULT_TOKEN_LIFETIME == timedelta(hours=1)
+
+
+async def test_concurrent_requests_share_one_login() -> None:
+    client = RestClient("host", "admin", "pw", MagicMock(), model=MODEL_NEXT)
+    logins = 0
+
+    async def _login() -> None:
+        nonlocal logins
+        logins += 1
+        await asyncio.sleep(0)
+        client._token = "token"
+        client._token_refresh_at = time.monotonic() + DEFAULT_TOKEN_LIFETIME.total_seconds()
+
+    client._login = _login  # type: ignore[method-assign]
+
+    await asyncio.gather(*(client._ensure_token() for _ in range(3)))
+    assert logins == 1
+
+    # A 401 on a token that was already replaced does not log in again.
+    await client._relogin("stale-token")
+    assert logins == 1
+    await client._relogin("token")
+    assert logins == 2
+
+
+class _FakeResponse:
+    content_type = "application/json"
+
+    def __init__(self, status: int, body: object = None, etag: str | None = None) -> None:
+        self.status = status
+        self._body = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    async def json(self, **_: object) -> object:
+        return self._body
+
+    async def __aenter__(self) -> _FakeResponse:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+async def test_get_reuses_cached_body_on_not_modified() -> None:
+    session = MagicMock()
+    session.request.side_effect = [
+        _FakeResponse(200, [{"fieldKey": "plug-cycles", "value": 1}], etag='"v1"'),
+        _FakeResponse(304),
+    ]
+    client = RestClient("host", "admin", "pw", session, model=MODEL_NEXT)
+    client._ensure_token = AsyncMock()  # type: ignore[method-assign]
+    client._token = "token"
+
+    first = await client._get_section("system")
+    second = await client._get_section("system")
+
+    assert second == first
+    assert "If-None-Match" not in session.request.call_args_list[0].kwargs["headers"]
+    assert session.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+async def test_disconnect_drops_cached_bodies() -> None:
+    session = MagicMock()
+    session.request.side_effect = [
+        _FakeResponse(200, [{"fieldKey": "plug-cycles", "value": 1}], etag='"v1"'),
+        _FakeResponse(200, [{"fieldKey": "plug-cycles", "value": 2}], etag='"v2"'),
+    ]
+    client = RestClient("host", "admin", "pw", session, model=MODEL_NEXT)
+    client._ensure_token = AsyncMock()  # type: ignore[method-assign]
+    client._token = "token"
+
+    await client._get_section("system")
+    await client.disconnect()
+    client._token = "token"
+    await client._get_section("system")
+
+    # The first request after reconnecting is unconditional.
+    assert "If-None-Match" not in session.request.call_args_list[1].kwargs["headers"]
+
+
+async def test_concurrent_config_updates_share_one_request() -> None:
+    client = _unite_client()
+    client._post = AsyncMock()  # type: ignore[method-assign]
+
+    await asyncio.gather(
+        client.set_free_charging(True),
+        client.set_led_dimming_level("low"),
+    )
+
+    client._post.assert_awaited_once_with(
+        "/configuration-updates",
+        json=[
+            RestClient._unite_update("ocppConfigurations.freeModeActive", "TRUE"),
+            RestClient._unite_update("generalSettings.ledDimmingLevel", "low"),
+        ],
+    )
+
+    # An update after the shared request was sent starts a new one.
+    await client.set_randomised_delay(60)
+    assert client._post.await_count == 2
+
+
+async def test_failed_config_update_reaches_every_caller() -> None:
+    client = _unite_client()
+    client._post = AsyncMock(side_effect=RestClientError("rejected"))  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        client.set_free_charging(True),
+        client.set_randomised_delay(60),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [RestClientError, RestClientError]
+    assert client._post.await_count == 1
+
+
+async def test_cancelled_caller_does_not_drop_shared_config_update() -> None:
+    client = _unite_client()
+    client._post = AsyncMock()  # type: ignore[method-assign]
+
+    first = asyncio.create_task(client.set_free_charging(True))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(client.set_led_dimming_level("low"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+
+    # The request belongs to the client: it still goes out with both updates.
+    client._post.assert_awaited_once_with(
+        "/configuration-updates",
+        json=[
+            RestClient._unite_update("ocppConfigurations.freeModeActive", "TRUE"),
+            RestClient._unite_update("generalSettings.ledDimmingLevel", "low"),
+        ],
+    )
+
+
+async def test_disconnect_cancels_pending_config_update() -> None:
+    client = _unite_client()
+    client._post = AsyncMock()  # type: ignore[method-assign]
+
+    update = asyncio.create_task(client.set_free_charging(True))
+    await asyncio.sleep(0)
+    await client.disconnect()
+
+    with pytest.raises(asyncio.CancelledError):
+        await update
+    client._post.assert_not_awaited()
+    assert not client._config_flushes_in_flight
+
+    # A later update starts a fresh request.
+    await client.set_randomised_delay(60)
+    client._post.assert_awaited_once()
+
+
+async def test_short_lived_token_is_renewed_before_it_expires() -> None:
+    session = MagicMock()
+    session.post.return_value = _FakeResponse(
+        200, {"access_token": _jwt({"iat": 1000, "exp": 1060})}
+    )
+    client = RestClient("host", "admin", "pw", session, model=MODEL_NEXT)
+
+    before = time.monotonic()
+    await client.connect()
+
+    # Half of the one-minute lifetime instead of the five-minute margin
+    assert client.is_connected
+    assert before + 30 <= client._token_refresh_at <= time.monotonic() + 30
+
+
+async def test_expired_token_is_renewed_on_the_next_request() -> None:
+    session = MagicMock()
+    session.post.return_value = _FakeResponse(
+        200, {"access_token": _jwt({"iat": 1000, "exp": 1000})}
+    )
+    client = RestClient("host", "admin", "pw", session, model=MODEL_NEXT)
+
+    await client.connect()
+
+    # Not treated as fresh for the default hour: the next request logs in again.
+    assert not client.is_connected
+    assert client._token_refresh_at <= time.monotonic()
+
+
+async def test_token_without_iat_tolerates_a_clock_behind() -> None:
+    # A wallbox clock running behind issues tokens whose exp is already in
+    # the local past; they must not force a login on every request.
+    session = MagicMock()
+    session.post.return_value = _FakeResponse(
+        200, {"access_token": _jwt({"exp": int(time.time()) - 600})}
+    )
+    client = RestClient("host", "admin", "pw", session, model=MODEL_NEXT)
+
+    before = time.monotonic()
+    await client.connect()
+
+    assert client.is_connected
+    refresh_in = DEFAULT_TOKEN_LIFETIME - TOKEN_REFRESH_MARGIN
+    assert client._token_refresh_at >= before + refresh_in.total_seconds()
@@ -25,10 +25,10 @@ from custom_components.webasto_next_modbus import (
 from custom_components.webasto_next_modbus.const import (
     SESSION_COMMAND_START_VALUE,
     SESSION_COMMAND_STOP_VALUE,
-    SIGNAL_REGISTER_WRITTEN,
     VARIANT_11_KW,
     VARIANT_22_KW,
     build_device_slug,
+    build_register_written_signal,
     get_max_current_for_variant,
     get_register,
 )
@@ -144,9 +144,7 @@ async def test_service_set_current_clamps_and_refreshes(dispatcher_stub) -> None
     runtime.coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
     dispatcher_stub.assert_called_once_with(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        register.key,
+        build_register_written_signal(runtime.device_slug, register.key),
         runtime.max_current,
     )
 
@@ -176,16 +174,12 @@ async def test_service_set_failsafe_writes_optional_timeout(dispatcher_stub) ->
     assert dispatcher_stub.call_count == 2
     dispatcher_stub.assert_any_call(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        current_register.key,
+        build_register_written_signal(runtime.device_slug, current_register.key),
         runtime.max_current,
     )
     dispatcher_stub.assert_any_call(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        timeout_register.key,
+        build_register_written_signal(runtime.device_slug, timeout_register.key),
         timeout_register.max_value,
     )
 
@@ -209,9 +203,7 @@ async def test_service_variant_limits_current(dispatcher_stub) -> None:
     runtime.coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
     dispatcher_stub.assert_called_once_with(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        register.key,
+        build_register_written_signal(runtime.device_slug, register.key),
         runtime.max_current,
     )
 
@@ -235,9 +227,7 @@ async def test_service_variant_limits_failsafe(dispatcher_stub) -> None:
     runtime.coordinator.async_request_refresh.assert_awaited_once()  # type: ignore[attr-defined]
     dispatcher_stub.assert_called_once_with(
         call.hass,
-        SIGNAL_REGISTER_WRITTEN,
-        runtime.device_slug,
-        current_register.key,
+        build_register_written_signal(runtime.device_slug, current_register.key),
         runtime.max_current,
     )
 
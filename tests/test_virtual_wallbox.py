@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
 
 from custom_components.webasto_next_modbus.const import SESSION_COMMAND_START_VALUE, get_register
-from custom_components.webasto_next_modbus.hub import ModbusBridge
+from custom_components.webasto_next_modbus.hub import (
+    READ_METHODS,
+    ModbusBridge,
+    WebastoModbusDeviceError,
+    _build_read_plan,
+)
 from virtual_wallbox.server import VirtualWallboxDataBlock, VirtualWallboxDeviceContext
 from virtual_wallbox.simulator import (
     FakeAsyncModbusTcpClient,
@@ -54,6 +60,68 @@ async def test_bridge_reads_data_from_virtual_wallbox(
     assert data["active_power_total_w"] == 0
 
 
+@pytest.mark.asyncio
+async def test_bridge_concurrent_bulk_reads_share_one_read(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A bulk read requested while one is in flight reuses its result."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    read_once = bridge._async_read_data_once
+    calls = 0
+
+    async def _counting_read():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)  # the simulator never yields on its own
+        return await read_once()
+
+    monkeypatch.setattr(bridge, "_async_read_data_once", _counting_read)
+
+    first, second = await asyncio.gather(bridge.async_read_data(), bridge.async_read_data())
+
+    assert calls == 1
+    assert first is second
+    await bridge.async_read_data()
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_bridge_follower_reads_again_when_leader_is_cancelled(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Cancelling the caller that started a shared read doesn't cancel its followers."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    read_once = bridge._async_read_data_once
+    leader_reading = asyncio.Event()
+    calls = 0
+
+    async def _counting_read():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # Hold the leader's read until it is cancelled.
+            leader_reading.set()
+            await asyncio.Event().wait()
+        return await read_once()
+
+    monkeypatch.setattr(bridge, "_async_read_data_once", _counting_read)
+
+    leader = asyncio.create_task(bridge.async_read_data())
+    await leader_reading.wait()
+    follower = asyncio.create_task(bridge.async_read_data())
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert (await follower)["charging_state"] == 0
+    assert calls == 2
+
+
 @pytest.mark.asyncio
 async def test_bridge_write_actions_update_simulated_state(
     monkeypatch: pytest.MonkeyPatch,
@@ -280,3 +348,281 @@ async def test_bridge_prefers_device_id_keyword(monkeypatch: pytest.MonkeyPatch)
     assert isinstance(bridge._client, DeviceIdClient)
     assert bridge._client.calls
     assert all(call[1] == DeviceIdClient.expected_device_id for call in bridge._client.calls)
+
+
+def test_bridge_resolves_unit_keywords_from_client_class(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The unit keyword is read from the client's signatures, not probed per call."""
+
+    from custom_components.webasto_next_modbus import hub as hub_module
+
+    monkeypatch.setattr(
+        hub_module,
+        "_ensure_pymodbus",
+        lambda: (FakeAsyncModbusTcpClient, FakeModbusException),
+    )
+    bridge = ModbusBridge("203.0.113.6", 2502, 7)
+
+    assert bridge._unit_keywords == {
+        "read_holding_registers": "unit",
+        "read_input_registers": "unit",
+        "write_register": "unit",
+    }
+
+
+@pytest.mark.asyncio
+async def test_bridge_remembers_probed_unit_keyword(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A keyword found by probing is reused instead of probing again."""
+
+    from custom_components.webasto_next_modbus import hub as hub_module
+
+    monkeypatch.setattr(
+        hub_module,
+        "_ensure_pymodbus",
+        lambda: (FakeAsyncModbusTcpClient, FakeModbusException),
+    )
+    bridge = ModbusBridge("203.0.113.6", 2502, 7)
+    bridge._unit_keywords.clear()  # as for a client whose signatures hide the keyword
+    attempts: list[str] = []
+
+    async def read_input_registers(address: int, count: int = 1, **kwargs: int) -> str:
+        attempts.extend(kwargs)
+        if "unit" not in kwargs:
+            raise TypeError(
+                f"read_input_registers() got an unexpected keyword argument '{next(iter(kwargs))}'"
+            )
+        return "ok"
+
+    assert await bridge._invoke_with_unit(read_input_registers, 1000, count=1) == "ok"
+    assert attempts == ["device_id", "unit"]
+
+    attempts.clear()
+    assert await bridge._invoke_with_unit(read_input_registers, 1000, count=1) == "ok"
+    assert attempts == ["unit"]
+
+
+@pytest.mark.asyncio
+async def test_bridge_remembers_positional_unit_argument(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clients taking the unit id positionally are only probed once."""
+
+    from custom_components.webasto_next_modbus import hub as hub_module
+
+    monkeypatch.setattr(
+        hub_module,
+        "_ensure_pymodbus",
+        lambda: (FakeAsyncModbusTcpClient, FakeModbusException),
+    )
+    bridge = ModbusBridge("203.0.113.7", 2502, 9)
+    bridge._unit_keywords.clear()  # as for a client whose signatures hide the keyword
+    calls: list[tuple[object, ...]] = []
+
+    async def write_register(*args: int, **kwargs: int) -> str:
+        if kwargs:
+            keyword = next(iter(kwargs))
+            raise TypeError(f"write_register() got an unexpected keyword argument '{keyword}'")
+        calls.append(args)
+        return "ok"
+
+    assert await bridge._invoke_with_unit(write_register, 5004, 1) == "ok"
+    assert await bridge._invoke_with_unit(write_register, 5004, 0) == "ok"
+    assert calls == [(5004, 1, 9), (5004, 0, 9)]
+    assert bridge._unit_keywords["write_register"] == hub_module._POSITIONAL_UNIT
+
+
+@pytest.mark.asyncio
+async def test_bridge_reconnects_only_for_connection_errors(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed response is retried on the same connection; a dead socket reconnects."""
+
+    from custom_components.webasto_next_modbus import hub as hub_module
+
+    monkeypatch.setattr(hub_module, "RETRY_BACKOFF_SECONDS", 0)
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    register = get_register("charging_state")
+    await bridge.async_read_register(register)
+    client = bridge._client
+    assert client is not None
+
+    failures: list[Exception] = []
+    read = client.read_holding_registers
+
+    async def _flaky_read(address: int, count: int, *, unit: int):
+        if failures:
+            raise failures.pop()
+        return await read(address, count, unit=unit)
+
+    client.read_holding_registers = _flaky_read
+
+    failures.append(FakeModbusException("no response"))
+    assert await bridge.async_read_register(register) == 0
+    assert bridge._client is client
+
+    failures.append(ConnectionResetError("connection reset"))
+    assert await bridge.async_read_register(register) == 0
+    assert bridge._client is not client
+
+
+@pytest.mark.asyncio
+async def test_bridge_failure_count_restarts_with_the_connection(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Failures on an old socket must not count towards dropping the next one."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+
+    bridge._failures_since_reconnect = 2
+    await bridge.async_close()
+    assert bridge._failures_since_reconnect == 0
+
+    bridge._failures_since_reconnect = 2
+    await bridge.async_connect()
+    assert bridge._client is not None
+    assert bridge._failures_since_reconnect == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("core_block", [True, False], ids=["core-block", "later-block"])
+async def test_bridge_splits_blocks_whose_gap_registers_are_rejected(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+    core_block: bool,
+) -> None:
+    """A merged block failing with Illegal Data Address is re-read without its gaps."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    expected = await bridge.async_read_data()
+    plan = (*bridge._holding_plan, *bridge._input_plan)
+    # The first block doubles as the "is the wallbox answering" probe.
+    block = next(
+        request
+        for request in (plan[:1] if core_block else plan[1:])
+        if len(_build_read_plan(request.registers, max_gap=0)) > 1
+    )
+    client = bridge._client
+    assert client is not None
+    method_name = READ_METHODS[block.register_type]
+    read = getattr(client, method_name)
+
+    async def _strict_read(address: int, count: int, *, unit: int):
+        if (address, count) == (block.start_address, block.count):
+            return SimpleNamespace(exception_code=2, isError=lambda: True)
+        return await read(address, count, unit=unit)
+
+    setattr(client, method_name, _strict_read)
+
+    # Split and re-read within the same poll instead of going offline or
+    # losing the block's values.
+    assert await bridge.async_read_data() == expected
+    assert block not in (*bridge._holding_plan, *bridge._input_plan)
+
+    assert await bridge.async_read_data() == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("core_block", [True, False], ids=["core-block", "later-block"])
+async def test_bridge_keeps_block_when_split_reads_fail_too(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+    core_block: bool,
+) -> None:
+    """A refusal the split runs share (e.g. while booting) leaves the plan alone."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    expected = await bridge.async_read_data()
+    plan = (*bridge._holding_plan, *bridge._input_plan)
+    block = next(
+        request
+        for request in (plan[:1] if core_block else plan[1:])
+        if not request.optional and len(_build_read_plan(request.registers, max_gap=0)) > 1
+    )
+    client = bridge._client
+    assert client is not None
+    method_name = READ_METHODS[block.register_type]
+    read = getattr(client, method_name)
+    block_end = block.start_address + block.count
+
+    async def _refusing_read(address: int, count: int, *, unit: int):
+        if block.start_address <= address < block_end:
+            return SimpleNamespace(exception_code=2, isError=lambda: True)
+        return await read(address, count, unit=unit)
+
+    setattr(client, method_name, _refusing_read)
+
+    if core_block:
+        with pytest.raises(WebastoModbusDeviceError):
+            await bridge.async_read_data()
+    else:
+        data = await bridge.async_read_data()
+        assert all(data[definition.key] is None for definition in block.registers)
+    assert (*bridge._holding_plan, *bridge._input_plan) == plan
+
+    # Once the wallbox serves the block again, it is read in one piece.
+    setattr(client, method_name, read)
+    assert await bridge.async_read_data() == expected
+    assert (*bridge._holding_plan, *bridge._input_plan) == plan
+
+
+@pytest.mark.asyncio
+async def test_bridge_caches_failsafe_timeout_for_life_bit(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The life-bit window is read once and re-read only after a timeout write."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    reads: list[str] = []
+    read_register = bridge.async_read_register
+
+    async def _counting_read(register):
+        reads.append(register.key)
+        return await read_register(register)
+
+    monkeypatch.setattr(bridge, "async_read_register", _counting_read)
+
+    window = await bridge._async_life_bit_window()
+    assert await bridge._async_life_bit_window() == window
+    assert reads == ["failsafe_timeout_s"]
+
+    await bridge.async_write_register(get_register("failsafe_timeout_s"), 30)
+    assert await bridge._async_life_bit_window() == 30
+    assert reads == ["failsafe_timeout_s", "failsafe_timeout_s"]
+
+
+@pytest.mark.asyncio
+async def test_bridge_serialises_concurrent_writes(
+    default_virtual_wallbox,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Writes from several entities never overlap on the Modbus connection."""
+
+    bridge = await _make_bridge(monkeypatch, "127.0.0.1", 15020, default_virtual_wallbox.unit_id)
+    await bridge.async_connect()
+    client = bridge._client
+    assert client is not None
+    write = client.write_register
+    in_flight = 0
+    peak = 0
+
+    async def _tracking_write(address: int, value: int, *, unit: int):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        try:
+            return await write(address, value, unit=unit)
+        finally:
+            in_flight -= 1
+
+    client.write_register = _tracking_write
+
+    await asyncio.gather(
+        bridge.async_write_register(get_register("failsafe_current_a"), 10),
+        bridge.async_write_register(get_register("failsafe_timeout_s"), 30),
+        bridge.async_write_register(get_register("set_current_a"), 12),
+    )
+
+    assert peak == 1